@@ -5,6 +5,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
@@ -22,6 +27,9 @@ from genxai.core.graph.nodes import (
     ToolNode,
 )
 
+# Routes handled by a dedicated subflow; everything else takes the fallback edge.
+_ROUTED = frozenset({"support", "sales"})
+
 
 def build_global_graph() -> Graph:
     """Build the global workflow graph with deterministic routing + subflows."""
@@ -74,7 +82,7 @@ def build_global_graph() -> Graph:
         ConditionalEdge(
             source="route",
             target="fallback_subflow",
-            condition=lambda state: state.get("route") not in {"support", "sales"},
+            condition=lambda state: state.get("route") not in _ROUTED,
         )
     )
     graph.add_edge(Edge(source="support_subflow", target="read_file"))
@@ -85,11 +93,13 @@ def build_global_graph() -> Graph:
     graph.add_edge(Edge(source="validate_url", target="write_file"))
     graph.add_edge(Edge(source="write_file", target="query_db"))
     graph.add_edge(Edge(source="query_db", target="retry_checks"))
-    graph.add_edge(ConditionalEdge(
-        source="retry_checks",
-        target="query_db",
-        condition=lambda state: state.get("retry_needed") is True,
-    ))
+    graph.add_edge(
+        ConditionalEdge(
+            source="retry_checks",
+            target="query_db",
+            condition=lambda state: state.get("retry_needed") is True,
+        )
+    )
     graph.add_edge(Edge(source="retry_checks", target="send_email"))
     graph.add_edge(ParallelEdge(source="send_email", target="notify_slack"))
     graph.add_edge(ParallelEdge(source="send_email", target="call_webhook"))
@@ -136,35 +146,53 @@ def main() -> None:
     mermaid_path.write_text(mermaid_output)
     dot_path.write_text(dot_output)
 
-    graph_json = {
-        "name": graph.name,
-        "nodes": [
-            {"id": node.id, "type": node.type.value, "config": node.config.data}
-            for node in graph.nodes.values()
-        ],
-        "edges": [
+    # Snapshot nodes/edges once for the JSON emit.
+    nodes = list(graph.nodes.values())
+    edges = list(graph.edges)
+
+    edge_entries = []
+    for edge in edges:
+        condition = getattr(edge, "condition", None)
+        edge_entries.append(
             {
                 "source": edge.source,
                 "target": edge.target,
-                "condition": (
-                    getattr(edge, "condition", None).__name__
-                    if callable(getattr(edge, "condition", None))
-                    else getattr(edge, "condition", None)
-                ),
+                "condition": condition.__name__ if callable(condition) else condition,
                 "parallel": edge.metadata.get("parallel", False),
             }
-            for edge in graph.edges
+        )
+
+    graph_json = {
+        "name": graph.name,
+        "nodes": [
+            {"id": node.id, "type": node.type.value, "config": node.config.data} for node in nodes
         ],
+        "edges": edge_entries,
     }
-    json_path.write_text(json.dumps(graph_json, indent=2))
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(graph_json, option=orjson.OPT_INDENT_2))
+    else:
+        json_path.write_text(json.dumps(graph_json, indent=2))
 
     print(f"Mermaid diagram saved to {mermaid_path}")
     print(f"DOT diagram saved to {dot_path}")
     print(f"JSON snapshot saved to {json_path}")
 
     try:
-        subprocess.run(["dot", "-Tsvg", str(dot_path), "-o", str(svg_path)], check=True)
-        subprocess.run(["dot", "-Tpng", str(dot_path), "-o", str(png_path)], check=True)
+        # One GraphViz invocation: the layout is computed once and emitted in both formats.
+        subprocess.run(
+            [
+                "dot",
+                str(dot_path),
+                "-Tsvg",
+                "-o",
+                str(svg_path),
+                "-Tpng",
+                "-o",
+                str(png_path),
+            ],
+            check=True,
+        )
         print(f"SVG diagram rendered to {svg_path}")
         print(f"PNG diagram rendered to {png_path}")
     except FileNotFoundError:
@@ -174,4 +202,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,72 @@
+"""Shared event loop for CLI commands that drive async APIs."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel tasks left on ``loop`` and wait for them, like ``asyncio.run``."""
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    for task in pending:
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during CLI shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+
+def _close_loop() -> None:
+    global _LOOP
+    loop, _LOOP = _LOOP, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        _cancel_all_tasks(loop)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+atexit.register(_close_loop)
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion on the process-wide CLI event loop.
+
+    Unlike ``asyncio.run`` the loop (and its selector) is created once and
+    reused, so chained commands in one process can share connection pools.
+    Tasks the coroutine leaves behind are cancelled when it returns, as with
+    ``asyncio.run``; the loop itself is closed at interpreter exit.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    try:
+        return _LOOP.run_until_complete(coro)
+    finally:
+        _cancel_all_tasks(_LOOP)
@@ -0,0 +1,19 @@
+"""Rich table construction helpers shared by CLI commands."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from rich.table import Table
+
+# (header, style) pairs describing a table's columns.
+ColumnTemplate = Sequence[tuple[str, str]]
+
+
+def make_table(title: str, columns: ColumnTemplate) -> Table:
+    """Build a Rich table with the given title and column template."""
+    table = Table(title=title)
+    add_column = table.add_column
+    for header, style in columns:
+        add_column(header, style=style)
+    return table
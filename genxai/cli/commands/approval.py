@@ -18,7 +18,7 @@ def approval():
 @approval.command("list")
 def list_approvals():
     """List approval requests."""
-    approvals = get_approval_service()._requests.values()
+    approvals = get_approval_service().list_requests()
     if not approvals:
         console.print("[yellow]No approval requests found.[/yellow]")
         return
@@ -30,8 +30,9 @@ def list_approvals():
     table.add_column("Actor", style="magenta")
     table.add_column("Status", style="yellow")
 
+    add_row = table.add_row
     for request in approvals:
-        table.add_row(
+        add_row(
             request.request_id,
             request.action,
             request.resource_id,
@@ -1,18 +1,35 @@
 """Audit log management CLI commands."""
 
 import csv
-import json
-from dataclasses import asdict
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
+from typing import BinaryIO, TextIO
 
 import click
 from rich.console import Console
-from rich.table import Table
 
-from genxai.security.audit import get_audit_log
+from genxai.cli.commands._tables import make_table
+from genxai.security.audit import AuditEvent, get_audit_log
+from genxai.utils.json_codec import dumps_bytes
 
 console = Console()
 
+# Large write buffer so exports hit the disk in a few big writes, not one per row.
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+_AUDIT_CSV_HEADER = ("action", "actor_id", "resource_id", "status", "timestamp")
+_AUDIT_CSV_FIELDS = attrgetter(*_AUDIT_CSV_HEADER)
+
+_AUDIT_TABLE_COLUMNS = (
+    ("Action", "cyan"),
+    ("Actor", "magenta"),
+    ("Resource", "green"),
+    ("Status", "yellow"),
+    ("Timestamp", "white"),
+)
+
 
 @click.group()
 def audit():
@@ -24,42 +41,31 @@ def audit():
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["table", "json", "csv"]),
+    type=click.Choice(["table", "json", "ndjson", "csv"]),
     default="table",
 )
 def list_events(output_format: str):
     """List audit events."""
-    events = get_audit_log().list_events()
-    if not events:
+    events = get_audit_log().iter_events()
+    first = next(events, None)
+    if first is None:
         console.print("[yellow]No audit events found.[/yellow]")
         return
+    events = chain([first], events)
 
     if output_format == "json":
-        data = [asdict(event) for event in events]
-        click.echo(json.dumps(data, default=str, indent=2))
+        _write_json_array(click.open_file("-", "wb"), events)
+        return
+
+    if output_format == "ndjson":
+        _write_ndjson(click.open_file("-", "wb"), events)
         return
 
     if output_format == "csv":
-        writer = csv.writer(click.get_text_stream("stdout"))
-        writer.writerow(["action", "actor_id", "resource_id", "status", "timestamp"])
-        for event in events:
-            writer.writerow(
-                [
-                    event.action,
-                    event.actor_id,
-                    event.resource_id,
-                    event.status,
-                    event.timestamp.isoformat(),
-                ]
-            )
+        _write_csv(click.open_file("-", "w"), events)
         return
 
-    table = Table(title="Audit Events")
-    table.add_column("Action", style="cyan")
-    table.add_column("Actor", style="magenta")
-    table.add_column("Resource", style="green")
-    table.add_column("Status", style="yellow")
-    table.add_column("Timestamp", style="white")
+    table = make_table("Audit Events", _AUDIT_TABLE_COLUMNS)
 
     for event in events:
         table.add_row(
@@ -78,35 +84,67 @@ def list_events(output_format: str):
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "csv"]),
+    type=click.Choice(["json", "ndjson", "csv"]),
     default="json",
 )
 def export_events(output_path: str, output_format: str):
-    """Export audit events to a JSON/CSV file."""
-    events = get_audit_log().list_events()
+    """Export audit events to a JSON/NDJSON/CSV file."""
+    events = get_audit_log().iter_events()
     export_path = Path(output_path)
+    suffix = f".{output_format}"
+    if export_path.suffix.lower() != suffix:
+        export_path = export_path.with_suffix(suffix)
+
     if output_format == "csv":
-        if export_path.suffix.lower() != ".csv":
-            export_path = export_path.with_suffix(".csv")
-        with export_path.open("w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(["action", "actor_id", "resource_id", "status", "timestamp"])
-            for event in events:
-                writer.writerow(
-                    [
-                        event.action,
-                        event.actor_id,
-                        event.resource_id,
-                        event.status,
-                        event.timestamp.isoformat(),
-                    ]
-                )
+        with export_path.open(
+            "w", encoding="utf-8", newline="", buffering=_EXPORT_BUFFER_SIZE
+        ) as file:
+            count = _write_csv(file, events)
     else:
-        if export_path.suffix.lower() != ".json":
-            export_path = export_path.with_suffix(".json")
-        export_path.write_text(json.dumps([asdict(event) for event in events], default=str, indent=2))
+        write = _write_ndjson if output_format == "ndjson" else _write_json_array
+        with export_path.open("wb", buffering=_EXPORT_BUFFER_SIZE) as file:
+            count = write(file, events)
+
+    console.print(f"[green]✓ Exported {count} events to {export_path}[/green]")
 
-    console.print(f"[green]✓ Exported {len(events)} events to {export_path}[/green]")
+
+def _write_json_array(stream: BinaryIO, events: Iterable[AuditEvent]) -> int:
+    """Write events as a JSON array, one record at a time; returns the count."""
+    count = 0
+    stream.write(b"[")
+    for event in events:
+        stream.write(b",\n  " if count else b"\n  ")
+        stream.write(dumps_bytes(event))
+        count += 1
+    stream.write(b"\n]\n" if count else b"]\n")
+    return count
+
+
+def _write_ndjson(stream: BinaryIO, events: Iterable[AuditEvent]) -> int:
+    """Write one JSON record per line; returns the count."""
+    count = 0
+    for event in events:
+        stream.write(dumps_bytes(event))
+        stream.write(b"\n")
+        count += 1
+    return count
+
+
+def _write_csv(stream: TextIO, events: Iterable[AuditEvent]) -> int:
+    """Write events as CSV with a header row; returns the count."""
+    count = 0
+
+    def rows() -> Iterator[tuple[str, ...]]:
+        nonlocal count
+        for event in events:
+            count += 1
+            *fields, timestamp = _AUDIT_CSV_FIELDS(event)
+            yield (*fields, timestamp.isoformat())
+
+    writer = csv.writer(stream)
+    writer.writerow(_AUDIT_CSV_HEADER)
+    writer.writerows(rows())
+    return count
 
 
 @audit.command("clear")
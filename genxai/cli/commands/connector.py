@@ -2,13 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
-from typing import Any
+from typing import Any, NamedTuple
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from genxai.connectors import (
     Connector,
@@ -22,10 +19,17 @@ from genxai.connectors import (
     SQSConnector,
     WebhookConnector,
 )
+from genxai.cli.commands._runtime import run_async
+from genxai.cli.commands._tables import make_table
 from genxai.connectors.config_store import ConnectorConfigEntry, ConnectorConfigStore
+from genxai.utils.json_codec import dumps_bytes, loads
 
 console = Console()
 
+_CATALOG_TABLE_COLUMNS = (("Type", "cyan"), ("Required Fields", "green"), ("Description", "white"))
+_HEALTH_TABLE_COLUMNS = (("Field", "cyan"), ("Value", "white"))
+_SAVED_TABLE_COLUMNS = (("Name", "cyan"), ("Type", "green"), ("Config", "white"))
+
 
 CONNECTOR_CATALOG: dict[str, dict[str, Any]] = {
     "kafka": {
@@ -76,6 +80,36 @@ CONNECTOR_CATALOG: dict[str, dict[str, Any]] = {
 }
 
 
+class _ConnectorSpec(NamedTuple):
+    connector_class: type[Connector]
+    required: tuple[str, ...]
+
+
+_UNKNOWN_MSG = "Unknown connector type '{}'. Use 'genxai connector list' to see options."
+
+
+def _require_spec(connector_type: str) -> _ConnectorSpec:
+    # Built per call: catalog entries are mutable (plugins and tests edit them).
+    meta = CONNECTOR_CATALOG.get(connector_type)
+    if meta is None:
+        raise click.ClickException(_UNKNOWN_MSG.format(connector_type))
+    return _ConnectorSpec(meta["class"], tuple(meta["required"]))
+
+
+def _catalog_payload() -> dict[str, dict[str, Any]]:
+    # Not memoized: the catalog is a mutable registry that plugins extend.
+    return {
+        name: {"required": meta["required"], "description": meta["description"]}
+        for name, meta in CONNECTOR_CATALOG.items()
+    }
+
+
+def _check_required(spec: _ConnectorSpec, config_data: dict[str, Any]) -> None:
+    missing = [field for field in spec.required if field not in config_data]
+    if missing:
+        raise click.ClickException(f"Missing required fields: {', '.join(missing)}")
+
+
 @click.group()
 def connector() -> None:
     """Manage GenXAI connectors."""
@@ -87,20 +121,10 @@ def connector() -> None:
 def list_connectors(output_format: str) -> None:
     """List available connector types."""
     if output_format == "json":
-        payload = {
-            name: {
-                "required": meta["required"],
-                "description": meta["description"],
-            }
-            for name, meta in CONNECTOR_CATALOG.items()
-        }
-        click.echo(json.dumps(payload, indent=2))
+        click.echo(dumps_bytes(_catalog_payload(), indent=True))
         return
 
-    table = Table(title="GenXAI Connectors")
-    table.add_column("Type", style="cyan")
-    table.add_column("Required Fields", style="green")
-    table.add_column("Description", style="white")
+    table = make_table("GenXAI Connectors", _CATALOG_TABLE_COLUMNS)
     for name, meta in CONNECTOR_CATALOG.items():
         table.add_row(name, ", ".join(meta["required"]) or "(none)", meta["description"])
     console.print(table)
@@ -118,20 +142,14 @@ def validate(
     config_name: str | None,
 ) -> None:
     """Validate connector configuration without starting it."""
-    connector_meta = CONNECTOR_CATALOG.get(connector_type)
-    if not connector_meta:
-        raise click.ClickException(
-            f"Unknown connector type '{connector_type}'. Use 'genxai connector list' to see options."
-        )
+    spec = _require_spec(connector_type)
 
     config_data = _load_config(config, config_name)
-    missing = [field for field in connector_meta["required"] if field not in config_data]
-    if missing:
-        raise click.ClickException(f"Missing required fields: {', '.join(missing)}")
+    _check_required(spec, config_data)
 
-    connector_instance = _build_connector(connector_id, connector_meta["class"], config_data)
+    connector_instance = spec.connector_class(connector_id=connector_id, **config_data)
     try:
-        asyncio.run(connector_instance.validate_config())
+        run_async(connector_instance.validate_config())
         console.print("[green]✓ Connector configuration valid[/green]")
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
@@ -146,7 +164,7 @@ def start(connector_type: str, connector_id: str, config: str | None, config_nam
     """Start a connector instance for quick validation."""
     connector_instance = _build_from_cli(connector_type, connector_id, config, config_name)
     try:
-        asyncio.run(connector_instance.start())
+        run_async(connector_instance.start())
         console.print("[green]✓ Connector started[/green]")
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
@@ -161,7 +179,7 @@ def stop(connector_type: str, connector_id: str, config: str | None, config_name
     """Stop a connector instance for quick validation."""
     connector_instance = _build_from_cli(connector_type, connector_id, config, config_name)
     try:
-        asyncio.run(connector_instance.stop())
+        run_async(connector_instance.stop())
         console.print("[green]✓ Connector stopped[/green]")
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
@@ -183,17 +201,15 @@ def health(
     """Run a connector health check without starting it."""
     connector_instance = _build_from_cli(connector_type, connector_id, config, config_name)
     try:
-        payload = asyncio.run(connector_instance.health_check())
+        payload = run_async(connector_instance.health_check())
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
 
     if output_format == "json":
-        click.echo(json.dumps(payload, indent=2))
+        click.echo(dumps_bytes(payload, indent=True))
         return
 
-    table = Table(title="Connector Health")
-    table.add_column("Field", style="cyan")
-    table.add_column("Value", style="white")
+    table = make_table("Connector Health", _HEALTH_TABLE_COLUMNS)
     for key, value in payload.items():
         table.add_row(str(key), str(value))
     console.print(table)
@@ -205,15 +221,9 @@ def health(
 @click.option("--config", required=True, help="JSON config payload")
 def save(config_name: str, connector_type: str, config: str) -> None:
     """Save a connector config for reuse."""
-    connector_meta = CONNECTOR_CATALOG.get(connector_type)
-    if not connector_meta:
-        raise click.ClickException(
-            f"Unknown connector type '{connector_type}'. Use 'genxai connector list' to see options."
-        )
+    spec = _require_spec(connector_type)
     config_data = _load_config(config, None)
-    missing = [field for field in connector_meta["required"] if field not in config_data]
-    if missing:
-        raise click.ClickException(f"Missing required fields: {', '.join(missing)}")
+    _check_required(spec, config_data)
 
     store = ConnectorConfigStore()
     store.save(
@@ -237,15 +247,12 @@ def list_saved(output_format: str) -> None:
             name: {"connector_type": entry.connector_type, "config": entry.config}
             for name, entry in entries.items()
         }
-        click.echo(json.dumps(payload, indent=2))
+        click.echo(dumps_bytes(payload, indent=True))
         return
 
-    table = Table(title="Saved Connector Configs")
-    table.add_column("Name", style="cyan")
-    table.add_column("Type", style="green")
-    table.add_column("Config", style="white")
+    table = make_table("Saved Connector Configs", _SAVED_TABLE_COLUMNS)
     for name, entry in entries.items():
-        table.add_row(name, entry.connector_type, json.dumps(entry.config))
+        table.add_row(name, entry.connector_type, dumps_bytes(entry.config).decode())
     console.print(table)
 
 
@@ -272,27 +279,16 @@ def keygen() -> None:
     click.echo(key)
 
 
-def _build_connector(connector_id: str, connector_class: type[Connector], config: dict[str, Any]) -> Connector:
-    params = {"connector_id": connector_id, **config}
-    return connector_class(**params)
-
-
 def _build_from_cli(
     connector_type: str,
     connector_id: str,
     config: str | None,
     config_name: str | None,
 ) -> Connector:
-    connector_meta = CONNECTOR_CATALOG.get(connector_type)
-    if not connector_meta:
-        raise click.ClickException(
-            f"Unknown connector type '{connector_type}'. Use 'genxai connector list' to see options."
-        )
+    spec = _require_spec(connector_type)
     config_data = _load_config(config, config_name)
-    missing = [field for field in connector_meta["required"] if field not in config_data]
-    if missing:
-        raise click.ClickException(f"Missing required fields: {', '.join(missing)}")
-    return _build_connector(connector_id, connector_meta["class"], config_data)
+    _check_required(spec, config_data)
+    return spec.connector_class(connector_id=connector_id, **config_data)
 
 
 def _load_config(config: str | None, config_name: str | None) -> dict[str, Any]:
@@ -302,7 +298,12 @@ def _load_config(config: str | None, config_name: str | None) -> dict[str, Any]:
         if not entry:
             raise click.ClickException(f"Config '{config_name}' not found")
         return entry.config
-    return json.loads(config) if config else {}
+    if not config:
+        return {}
+    try:
+        return loads(config)
+    except ValueError as exc:
+        raise click.ClickException(f"--config is not valid JSON: {exc}") from exc
 
 
 if __name__ == "__main__":
@@ -5,8 +5,10 @@ from typing import Any
 
 import click
 
+from genxai.cli.commands._runtime import run_async
 from genxai.core.graph import load_workflow_yaml, register_workflow_agents
 from genxai.core.graph.executor import WorkflowExecutor
+from genxai.utils.json_codec import dumps_bytes, loads
 
 
 @click.group()
@@ -19,23 +21,23 @@ def workflow() -> None:
 @click.option("--input", "input_payload", required=True, help="JSON input payload")
 def run_workflow(workflow_path: Path, input_payload: str) -> None:
     """Run a workflow from a YAML file."""
-    import json
-
     try:
         workflow = load_workflow_yaml(workflow_path)
     except (ValueError, FileNotFoundError) as exc:
         raise click.ClickException(str(exc)) from exc
     register_workflow_agents(workflow)
 
-    nodes = _build_nodes_from_workflow(workflow)
-    edges = _build_edges_from_workflow(workflow)
+    nodes, edges = _build_graph_from_workflow(workflow)
 
     executor = WorkflowExecutor()
-    input_data = json.loads(input_payload)
+    try:
+        input_data = loads(input_payload)
+    except ValueError as exc:
+        raise click.ClickException(f"--input is not valid JSON: {exc}") from exc
     shared_memory = workflow.get("memory", {}).get("shared", False)
 
     result = _run_executor(executor, nodes, edges, input_data, shared_memory=shared_memory)
-    click.echo(json.dumps(result, indent=2))
+    click.echo(dumps_bytes(result, indent=True))
 
 
 @workflow.command("generate")
@@ -60,8 +62,6 @@ def run_workflow(workflow_path: Path, input_payload: str) -> None:
 )
 def generate_workflow_cmd(request: str, model: str, output_path: Path | None, crew: bool) -> None:
     """Generate a workflow YAML from a natural-language REQUEST."""
-    import asyncio
-
     import yaml
 
     from genxai.builder.crew import crew_generate_workflow
@@ -78,7 +78,7 @@ def generate_workflow_cmd(request: str, model: str, output_path: Path | None, cr
             await provider.aclose()
 
     try:
-        result = asyncio.run(_generate())
+        result = run_async(_generate())
     except Exception as exc:
         raise click.ClickException(f"workflow generation failed: {exc}") from exc
 
@@ -121,8 +121,6 @@ def generate_workflow_cmd(request: str, model: str, output_path: Path | None, cr
 )
 def eval_generation_cmd(model: str, prompts: tuple[str, ...], crew: bool) -> None:
     """Measure how often NL requests yield schema-valid workflows."""
-    import asyncio
-
     from genxai.builder.crew import crew_generate_workflow
     from genxai.builder.generator import evaluate_generation
     from genxai.llm.factory import LLMProviderFactory
@@ -138,33 +136,32 @@ def eval_generation_cmd(model: str, prompts: tuple[str, ...], crew: bool) -> Non
         finally:
             await provider.aclose()
 
-    report = asyncio.run(_evaluate())
+    report = run_async(_evaluate())
     click.echo(report.summary())
     if report.validity_rate < 1.0:
         raise SystemExit(1)
 
 
-def _build_nodes_from_workflow(workflow: dict[str, Any]):
-    nodes = workflow.get("graph", {}).get("nodes", [])
+def _build_graph_from_workflow(workflow: dict[str, Any]):
+    graph = workflow.get("graph", {})
+    nodes = graph.get("nodes", [])
     if not isinstance(nodes, list):
         raise click.ClickException("workflow.graph.nodes must be a list")
-    return nodes
-
-
-def _build_edges_from_workflow(workflow: dict[str, Any]):
-    edges = workflow.get("graph", {}).get("edges", [])
+    edges = graph.get("edges", [])
     if not isinstance(edges, list):
         raise click.ClickException("workflow.graph.edges must be a list")
-    # Map YAML edge keys to executor expectations.
-    return [
-        {
-            "source": edge.get("from"),
-            "target": edge.get("to"),
-            "condition": edge.get("condition"),
-            "parallel": edge.get("parallel", False),
-        }
-        for edge in edges
-    ]
+    return nodes, list(map(_remap_edge, edges))
+
+
+def _remap_edge(edge: dict[str, Any]) -> dict[str, Any]:
+    """Map YAML edge keys to executor expectations."""
+    get = edge.get
+    return {
+        "source": get("from"),
+        "target": get("to"),
+        "condition": get("condition"),
+        "parallel": get("parallel", False),
+    }
 
 
 def _run_executor(
@@ -174,8 +171,6 @@ def _run_executor(
     input_data,
     shared_memory: bool = False,
 ):
-    import asyncio
-
     async def _execute():
         return await executor.execute(
             nodes=nodes,
@@ -184,4 +179,4 @@ def _run_executor(
             shared_memory=shared_memory,
         )
 
-    return asyncio.run(_execute())
+    return run_async(_execute())
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,11 +17,28 @@ class GenXAISettings(BaseSettings):
     tool_allowlist: list[str] = Field(default_factory=list)
     tool_denylist: list[str] = Field(default_factory=list)
 
-    def allowlist_set(self) -> set[str]:
-        return {name.strip() for name in self.tool_allowlist if name.strip()}
+    # Normalized sets, keyed on the list contents they were built from so that
+    # reassigning or editing the lists in place is picked up on the next check.
+    _allowlist: tuple[tuple[str, ...], frozenset[str]] | None = PrivateAttr(default=None)
+    _denylist: tuple[tuple[str, ...], frozenset[str]] | None = PrivateAttr(default=None)
 
-    def denylist_set(self) -> set[str]:
-        return {name.strip() for name in self.tool_denylist if name.strip()}
+    def allowlist_set(self) -> frozenset[str]:
+        self._allowlist = _normalized(self.tool_allowlist, self._allowlist)
+        return self._allowlist[1]
+
+    def denylist_set(self) -> frozenset[str]:
+        self._denylist = _normalized(self.tool_denylist, self._denylist)
+        return self._denylist[1]
+
+
+def _normalized(
+    names: list[str],
+    cached: tuple[tuple[str, ...], frozenset[str]] | None,
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    key = tuple(names)
+    if cached is not None and cached[0] == key:
+        return cached
+    return key, frozenset(name.strip() for name in key if name.strip())
 
 
 _settings: GenXAISettings | None = None
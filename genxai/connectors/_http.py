@@ -0,0 +1,98 @@
+"""Shared HTTP client construction and response caching for REST API connectors."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from importlib.util import find_spec
+from typing import Any
+
+import httpx
+
+# Pool sizing for fan-out workloads (bulk syncs, webhook bursts). httpx's defaults
+# keep too few idle connections alive, forcing fresh TCP/TLS handshakes.
+CONNECTOR_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# HTTP/2 lets concurrent calls to one API host multiplex over a single
+# connection. httpx needs the optional ``h2`` package for it.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def build_async_client(
+    base_url: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> httpx.AsyncClient:
+    """Create the pooled ``httpx.AsyncClient`` a REST connector talks through.
+
+    Args:
+        base_url: API root the connector's request paths are relative to
+        headers: Default headers (auth, content negotiation) for every request
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        A client using the shared connector pool limits, speaking HTTP/2 when
+        ``h2`` is installed
+    """
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        limits=CONNECTOR_HTTP_LIMITS,
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+class ETagCache:
+    """Bounded LRU of response bodies for conditional ``GET`` requests.
+
+    Bodies are kept as raw bytes, so callers always decode a fresh object
+    and cannot mutate what is cached.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, tuple[tuple[str, Any], ...]], tuple[str, bytes]] = (
+            OrderedDict()
+        )
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        """``GET`` ``path``, revalidating a cached body with ``If-None-Match``.
+
+        Args:
+            client: Client to send the request through
+            path: Request path or URL
+            params: Query parameters
+
+        Returns:
+            The response body, taken from the cache on ``304 Not Modified``
+
+        Raises:
+            httpx.HTTPStatusError: If the response is an error
+        """
+        params = params or {}
+        key = (path, tuple(sorted(params.items())))
+        cached = self._entries.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await client.get(path, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            self._entries.move_to_end(key)
+            return cached[1]
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._entries[key] = (etag, response.content)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.pop(key, None)
+        return response.content
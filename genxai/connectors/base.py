@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
@@ -13,6 +15,28 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+ERROR_BACKOFF_MAX_SECONDS = 30.0
+_ERROR_BACKOFF_MIN_SECONDS = 0.1
+
+
+def error_backoff(base: float, failures: int) -> float:
+    """Delay before a consumer loop retries after consecutive failures.
+
+    Doubles per failure from ``base`` (at least 0.1s) up to
+    ``ERROR_BACKOFF_MAX_SECONDS``, plus up to 10% jitter so connectors that
+    failed together don't retry in lockstep.
+
+    Args:
+        base: Delay after the first failure, usually the poll interval
+        failures: Number of consecutive failures so far (1 or more)
+
+    Returns:
+        Seconds to sleep
+    """
+    delay = max(base, _ERROR_BACKOFF_MIN_SECONDS) * 2 ** min(failures - 1, 16)
+    delay = min(delay, ERROR_BACKOFF_MAX_SECONDS)
+    return delay + random.uniform(0, delay * 0.1)
+
 
 class ConnectorStatus(str, Enum):
     """Lifecycle status for connectors."""
@@ -44,7 +68,14 @@ class Connector(ABC):
         self._callbacks: list[Callable[[ConnectorEvent], Awaitable[None]]] = []
         self._lock = asyncio.Lock()
         self._last_error: str | None = None
-        self._last_healthcheck: str | None = None
+        self._last_healthcheck_ns: int | None = None
+
+    @property
+    def last_healthcheck(self) -> str | None:
+        """ISO 8601 time of the most recent health check, if any."""
+        if self._last_healthcheck_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_healthcheck_ns / 1e9, UTC).isoformat()
 
     def on_event(self, callback: Callable[[ConnectorEvent], Awaitable[None]]) -> None:
         """Register a callback to receive connector events."""
@@ -57,11 +88,19 @@ class Connector(ABC):
             payload=payload,
             metadata=metadata or {},
         )
-        if not self._callbacks:
+        callbacks = self._callbacks
+        if not callbacks:
             logger.warning("Connector %s emitted event with no subscribers", self.connector_id)
             return
+        if len(callbacks) == 1:
+            # Most connectors have a single subscriber; skip gather's
+            # task/future wrapping and await it inline. Still yield once so
+            # poll loops whose callbacks never suspend cannot starve the loop.
+            await callbacks[0](event)
+            await asyncio.sleep(0)
+            return
 
-        await asyncio.gather(*[callback(event) for callback in self._callbacks])
+        await asyncio.gather(*[callback(event) for callback in callbacks])
 
     async def start(self) -> None:
         """Start the connector."""
@@ -107,7 +146,7 @@ class Connector(ABC):
             "lifecycle": self.status.value,
             "last_error": self._last_error,
         }
-        self._last_healthcheck = datetime.now(UTC).isoformat()
+        self._last_healthcheck_ns = time.time_ns()
         return payload
 
     async def validate_config(self) -> None:
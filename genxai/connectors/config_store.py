@@ -2,12 +2,56 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
 import os
+import stat
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from genxai.utils.json_codec import dumps_bytes, loads
+
+_FERNET_CLASS: Any = None
+
+
+def _fernet_class() -> Any:
+    """Import ``cryptography.fernet.Fernet`` once, on first use."""
+    global _FERNET_CLASS
+    if _FERNET_CLASS is None:
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as exc:
+            raise ImportError(
+                "cryptography is required for encrypted connector configs. "
+                "Install with: pip install cryptography"
+            ) from exc
+        _FERNET_CLASS = Fernet
+    return _FERNET_CLASS
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file so readers never see a partial file.
+
+    The temp file is created with mode 0600; when ``path`` already exists its
+    mode is carried over so a tightened permission is never loosened.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
 
 @dataclass
 class ConnectorConfigEntry:
@@ -26,6 +70,11 @@ class ConnectorConfigStore:
     def __init__(self, path: Path | None = None, encryption_key: str | None = None) -> None:
         self.path = path or Path(".genxai/connectors.json")
         self.encryption_key = encryption_key or os.getenv("GENXAI_CONNECTOR_CONFIG_KEY")
+        self._fernet: Any = None
+        self._fernet_key: str | None = None
+        # (file version, plaintext) of the last read, so a save/delete that reads
+        # and then rewrites the store decrypts it only once.
+        self._plaintext: tuple[tuple[int, int, int, str | None], bytes | str] | None = None
 
     def list(self) -> dict[str, ConnectorConfigEntry]:
         data = self._read_raw()
@@ -66,36 +115,39 @@ class ConnectorConfigStore:
         return True
 
     def _read_raw(self) -> dict[str, Any]:
-        if not self.path.exists():
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
             return {}
-        raw = json.loads(self.path.read_text())
+        version = (st.st_ino, st.st_mtime_ns, st.st_size, self.encryption_key)
+        if self._plaintext is not None and self._plaintext[0] == version:
+            return loads(self._plaintext[1])
+
+        contents = self.path.read_bytes()
+        raw = loads(contents)
         if isinstance(raw, dict) and raw.get("encrypted"):
             payload = raw.get("payload")
             if not payload:
                 raise ValueError("Encrypted connector config missing payload")
-            return json.loads(self._decrypt(payload))
+            contents = self._decrypt(payload)
+            raw = loads(contents)
+        self._plaintext = (version, contents)
         return raw
 
     def _write_raw(self, data: dict[str, Any]) -> None:
+        self._plaintext = None
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if self.encryption_key:
-            encrypted = self._encrypt(json.dumps(data))
-            payload = {"encrypted": True, "payload": encrypted}
-            self.path.write_text(json.dumps(payload, indent=2))
-            return
-        self.path.write_text(json.dumps(data, indent=2))
+            data = {"encrypted": True, "payload": self._encrypt(dumps_bytes(data).decode())}
+        _atomic_write_bytes(self.path, dumps_bytes(data, indent=True))
 
     def _get_fernet(self):
         if not self.encryption_key:
             raise ValueError("Encryption key not configured")
-        try:
-            from cryptography.fernet import Fernet
-        except ImportError as exc:
-            raise ImportError(
-                "cryptography is required for encrypted connector configs. "
-                "Install with: pip install cryptography"
-            ) from exc
-        return Fernet(self.encryption_key.encode())
+        if self._fernet is None or self._fernet_key != self.encryption_key:
+            self._fernet = _fernet_class()(self.encryption_key.encode())
+            self._fernet_key = self.encryption_key
+        return self._fernet
 
     def _encrypt(self, payload: str) -> str:
         fernet = self._get_fernet()
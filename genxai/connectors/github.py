@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from genxai.utils.json_codec import loads
+
+from ._http import ETagCache, build_async_client
 from .base import Connector
 
 logger = logging.getLogger(__name__)
@@ -34,11 +38,11 @@ class GitHubConnector(Connector):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
-        self._lock = asyncio.Lock()
+        self._etag_cache = ETagCache()
 
     async def _start(self) -> None:
         if not self._client:
-            self._client = httpx.AsyncClient(
+            self._client = build_async_client(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.token}",
@@ -74,6 +78,40 @@ class GitHubConnector(Connector):
             params={"state": state, "per_page": per_page},
         )
 
+    async def iter_all_issues(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "open",
+        concurrency: int = 8,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every issue in a repository, in page order.
+
+        Page 1 is fetched with ``per_page=100`` to learn the page count from
+        the ``Link: rel="last"`` header; the remaining pages are then fetched
+        concurrently, at most ``concurrency`` at a time.
+        """
+        path = f"/repos/{owner}/{repo}/issues"
+        params: dict[str, Any] = {"state": state, "per_page": 100}
+        response = await self._get_response(path, params={**params, "page": 1})
+        for issue in loads(response.content):
+            yield issue
+
+        last = response.links.get("last", {}).get("url")
+        if not last:
+            return
+        last_page = int(httpx.URL(last).params.get("page", 1))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._get(path, params={**params, "page": page})
+
+        pages = await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1)))
+        for issues in pages:
+            for issue in issues:
+                yield issue
+
     async def create_issue(
         self,
         owner: str,
@@ -96,22 +134,30 @@ class GitHubConnector(Connector):
         await self.emit(payload=payload, metadata={"headers": headers or {}})
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.get(path, params=params or {})
+        # Conditional requests answered with 304 don't count against the rate limit.
+        client = await self._ensure_client()
+        return loads(await self._etag_cache.get(client, path, params))
+
+    async def _get_response(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        client = await self._ensure_client()
+        response = await client.get(path, params=params or {})
         response.raise_for_status()
-        return response.json()
+        return response
 
     async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.post(path, json=payload)
+        client = await self._ensure_client()
+        response = await client.post(path, json=payload)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
-    async def _ensure_client(self) -> None:
-        if self._client is not None:
-            return
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is not None:
+            return client
         async with self._lock:
             if self._client is None:
                 await self._start()
+        assert self._client is not None
+        return self._client
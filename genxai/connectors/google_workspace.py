@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from genxai.utils.json_codec import loads
+
+from ._http import ETagCache, build_async_client
 from .base import Connector
 
 logger = logging.getLogger(__name__)
@@ -34,11 +38,11 @@ class GoogleWorkspaceConnector(Connector):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
-        self._lock = asyncio.Lock()
+        self._etag_cache = ETagCache()
 
     async def _start(self) -> None:
         if not self._client:
-            self._client = httpx.AsyncClient(
+            self._client = build_async_client(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
@@ -166,6 +170,35 @@ class GoogleWorkspaceConnector(Connector):
             params["q"] = query
         return await self._get("/drive/v3/files", params=params)
 
+    async def iter_drive_files(
+        self, page_size: int = 100, query: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every Drive file matching ``query``, following ``nextPageToken``.
+
+        The request for the next page is started before the current page's
+        files are yielded, so network latency overlaps with the caller's work.
+        """
+        params: dict[str, Any] = {"pageSize": page_size}
+        if query:
+            params["q"] = query
+        pending = asyncio.ensure_future(self._get("/drive/v3/files", params=params))
+        try:
+            while pending is not None:
+                page = await pending
+                token = page.get("nextPageToken")
+                pending = (
+                    asyncio.ensure_future(
+                        self._get("/drive/v3/files", params={**params, "pageToken": token})
+                    )
+                    if token
+                    else None
+                )
+                for item in page.get("files", []):
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     async def get_calendar_events(
         self,
         calendar_id: str = "primary",
@@ -251,11 +284,8 @@ class GoogleWorkspaceConnector(Connector):
         await self.emit(payload=payload, metadata={"headers": headers or {}})
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.get(path, params=params or {})
-        response.raise_for_status()
-        return response.json()
+        client = await self._ensure_client()
+        return loads(await self._etag_cache.get(client, path, params))
 
     async def _post(
         self,
@@ -263,11 +293,10 @@ class GoogleWorkspaceConnector(Connector):
         payload: dict[str, Any],
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.post(path, params=params or {}, json=payload)
+        client = await self._ensure_client()
+        response = await client.post(path, params=params or {}, json=payload)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     async def _put(
         self,
@@ -275,15 +304,17 @@ class GoogleWorkspaceConnector(Connector):
         payload: dict[str, Any],
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.put(path, params=params or {}, json=payload)
+        client = await self._ensure_client()
+        response = await client.put(path, params=params or {}, json=payload)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
-    async def _ensure_client(self) -> None:
-        if self._client is not None:
-            return
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is not None:
+            return client
         async with self._lock:
             if self._client is None:
                 await self._start()
+        assert self._client is not None
+        return self._client
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 import httpx
 
+from genxai.utils.json_codec import loads
+
+from ._http import build_async_client
 from .base import Connector
 
 logger = logging.getLogger(__name__)
@@ -37,11 +39,10 @@ class HubSpotConnector(Connector):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
-        self._lock = asyncio.Lock()
 
     async def _start(self) -> None:
         if not self._client:
-            self._client = httpx.AsyncClient(
+            self._client = build_async_client(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
@@ -174,18 +175,20 @@ class HubSpotConnector(Connector):
     async def _request(
         self, method: str, path: str, payload: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.request(method, path, json=payload)
+        client = await self._ensure_client()
+        response = await client.request(method, path, json=payload)
         if response.status_code >= 400:
             raise ValueError(
                 f"HubSpot API error ({response.status_code}): {response.text}"
             )
-        return response.json() if response.content else {}
+        return loads(response.content) if response.content else {}
 
-    async def _ensure_client(self) -> None:
-        if self._client is not None:
-            return
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is not None:
+            return client
         async with self._lock:
             if self._client is None:
                 await self._start()
+        assert self._client is not None
+        return self._client
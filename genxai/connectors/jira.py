@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 import logging
 from typing import Any
 
 import httpx
 
+from genxai.utils.json_codec import loads
+
+from ._http import build_async_client
 from .base import Connector
 
 logger = logging.getLogger(__name__)
@@ -37,13 +39,12 @@ class JiraConnector(Connector):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
-        self._lock = asyncio.Lock()
 
     async def _start(self) -> None:
         if not self._client:
             token = f"{self.email}:{self.api_token}".encode()
             auth_header = base64.b64encode(token).decode("utf-8")
-            self._client = httpx.AsyncClient(
+            self._client = build_async_client(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Basic {auth_header}",
@@ -87,22 +88,23 @@ class JiraConnector(Connector):
         await self.emit(payload=payload, metadata={"headers": headers or {}})
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.get(path, params=params or {})
+        client = await self._ensure_client()
+        response = await client.get(path, params=params or {})
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.post(path, json=payload)
+        client = await self._ensure_client()
+        response = await client.post(path, json=payload)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
-    async def _ensure_client(self) -> None:
-        if self._client is not None:
-            return
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is not None:
+            return client
         async with self._lock:
             if self._client is None:
                 await self._start()
+        assert self._client is not None
+        return self._client
@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from collections.abc import Callable
 from typing import Any
 
-from .base import Connector
+from genxai.utils.json_codec import loads
+
+from .base import Connector, error_backoff
 
 logger = logging.getLogger(__name__)
 
+# ``getmany`` returns whatever the fetcher has buffered, up to this many
+# records, waiting at most this long when nothing is buffered.
+FETCH_MAX_RECORDS = 500
+FETCH_TIMEOUT_MS = 500
+
+# Batches whose raw values total at least this many bytes are decoded in a
+# worker thread. The decoder holds the GIL, but the interpreter's switch
+# interval still lets the event loop run between slices of a long decode.
+OFFLOAD_DECODE_BYTES = 1024 * 1024
+
 
 class KafkaConnector(Connector):
     """Kafka connector using aiokafka."""
@@ -43,7 +54,6 @@ class KafkaConnector(Connector):
             bootstrap_servers=self.bootstrap_servers,
             group_id=self.group_id,
             enable_auto_commit=True,
-            value_deserializer=self.value_deserializer,
         )
         await self._consumer.start()
         self._task = asyncio.create_task(self._consume_loop())
@@ -64,10 +74,50 @@ class KafkaConnector(Connector):
             raise ValueError("Kafka bootstrap_servers must be provided")
 
     async def _consume_loop(self) -> None:
+        failures = 0
         while True:
             try:
-                msg = await self._consumer.getone()
-                payload = msg.value
+                batches = await self._consumer.getmany(
+                    timeout_ms=FETCH_TIMEOUT_MS, max_records=FETCH_MAX_RECORDS
+                )
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                failures += 1
+                logger.error("Kafka consumer error: %s", exc)
+                await asyncio.sleep(error_backoff(self.poll_interval, failures))
+                continue
+
+            try:
+                failed = 0
+                for records in batches.values():
+                    failed += await self._emit_batch(records)
+                # Failed records are logged and skipped, but back off before
+                # the next fetch so a persistently failing subscriber doesn't
+                # spin through the topic.
+                if failed:
+                    failures += 1
+                    await asyncio.sleep(error_backoff(self.poll_interval, failures))
+                else:
+                    failures = 0
+            except asyncio.CancelledError:
+                break
+
+    async def _emit_batch(self, records: list[Any]) -> int:
+        """Emit each record of one partition's batch, continuing past failures.
+
+        Returns:
+            Number of records that could not be decoded or emitted
+        """
+        try:
+            payloads = await self._decode_batch(records)
+        except Exception as exc:
+            logger.error("Kafka batch decode failed, skipped %d records: %s", len(records), exc)
+            return len(records)
+
+        failed = 0
+        for msg, payload in zip(records, payloads, strict=True):
+            try:
                 await self.emit(
                     payload=payload,
                     metadata={
@@ -77,16 +127,33 @@ class KafkaConnector(Connector):
                         "timestamp": msg.timestamp,
                     },
                 )
-            except asyncio.CancelledError:
-                break
             except Exception as exc:
-                logger.error("Kafka consumer error: %s", exc)
-                await asyncio.sleep(self.poll_interval)
+                failed += 1
+                logger.error(
+                    "Kafka emit failed for %s[%s]@%s: %s",
+                    msg.topic,
+                    msg.partition,
+                    msg.offset,
+                    exc,
+                )
+        if failed:
+            logger.warning("Kafka emit failed for %d of %d records", failed, len(records))
+        return failed
+
+    async def _decode_batch(self, records: list[Any]) -> list[Any]:
+        raw = [msg.value for msg in records]
+        if sum(len(value) for value in raw if value is not None) >= OFFLOAD_DECODE_BYTES:
+            return await asyncio.to_thread(self._decode_values, raw)
+        return self._decode_values(raw)
+
+    def _decode_values(self, raw: list[bytes | None]) -> list[Any]:
+        decode = self.value_deserializer
+        return [None if value is None else decode(value) for value in raw]
 
     def _default_deserializer(self, raw: bytes) -> Any:
         try:
-            return json.loads(raw.decode("utf-8"))
-        except Exception:
+            return loads(raw)
+        except ValueError:  # not JSON, or not UTF-8
             return raw
 
     async def handle_message(self, payload: dict[str, Any]) -> None:
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 import httpx
 
+from genxai.utils.json_codec import loads
+
+from ._http import build_async_client
 from .base import Connector
 
 logger = logging.getLogger(__name__)
@@ -36,11 +38,10 @@ class NotionConnector(Connector):
         self.notion_version = notion_version
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
-        self._lock = asyncio.Lock()
 
     async def _start(self) -> None:
         if not self._client:
-            self._client = httpx.AsyncClient(
+            self._client = build_async_client(
                 base_url=self.base_url,
                 headers={
                     "Authorization": f"Bearer {self.token}",
@@ -76,22 +77,23 @@ class NotionConnector(Connector):
         await self.emit(payload=payload, metadata={"headers": headers or {}})
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.get(path, params=params or {})
+        client = await self._ensure_client()
+        response = await client.get(path, params=params or {})
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        await self._ensure_client()
-        assert self._client is not None
-        response = await self._client.post(path, json=payload)
+        client = await self._ensure_client()
+        response = await client.post(path, json=payload)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
-    async def _ensure_client(self) -> None:
-        if self._client is not None:
-            return
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is not None:
+            return client
         async with self._lock:
             if self._client is None:
                 await self._start()
+        assert self._client is not None
+        return self._client
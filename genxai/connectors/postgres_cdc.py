@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any
 
-from .base import Connector
+from genxai.utils.json_codec import loads
+
+from .base import Connector, error_backoff
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on WAL changes decoded per poll, so a large backlog is pulled
+# in bounded batches instead of one result set held in memory at once.
+# Postgres only stops at transaction boundaries, so a batch may run over.
+MAX_CHANGES_PER_POLL = 1000
+
 
 class PostgresCDCConnector(Connector):
     """Postgres CDC connector using wal2json output plugin."""
@@ -59,35 +65,41 @@ class PostgresCDCConnector(Connector):
     async def _ensure_slot(self) -> None:
         assert self._conn is not None
         await self._conn.execute(
-            "SELECT * FROM pg_create_logical_replication_slot($1, 'wal2json') "
-            "ON CONFLICT DO NOTHING;",
+            "SELECT pg_create_logical_replication_slot($1, 'wal2json') "
+            "WHERE NOT EXISTS (SELECT 1 FROM pg_replication_slots WHERE slot_name = $1);",
             self.slot_name,
         )
 
     async def _consume_loop(self) -> None:
+        failures = 0
         while True:
             try:
                 assert self._conn is not None
                 rows = await self._conn.fetch(
-                    "SELECT data FROM pg_logical_slot_get_changes($1, NULL, NULL, 'pretty-print', '1')",
+                    "SELECT data FROM pg_logical_slot_get_changes($1, NULL, $2)",
                     self.slot_name,
+                    MAX_CHANGES_PER_POLL,
                 )
+                failures = 0
                 for row in rows:
                     payload = self._deserialize(row["data"])
                     await self.emit(payload=payload)
-                await asyncio.sleep(self.poll_interval)
+                # Drain a backlog without pausing; only wait once the slot is empty.
+                if not rows:
+                    await asyncio.sleep(self.poll_interval)
             except asyncio.CancelledError:
                 break
             except Exception as exc:
+                failures += 1
                 logger.error("Postgres CDC error: %s", exc)
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(error_backoff(self.poll_interval, failures))
 
     def _deserialize(self, raw: str | None) -> Any:
         if raw is None:
             return None
         try:
-            return json.loads(raw)
-        except Exception:
+            return loads(raw)
+        except ValueError:
             return raw
 
     async def handle_change(self, payload: dict[str, Any]) -> None:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 
 from .base import Connector
 
@@ -34,10 +36,30 @@ class ConnectorRegistry:
 
     @classmethod
     async def start_all(cls) -> None:
-        for connector in cls._connectors.values():
-            await connector.start()
+        await cls._run_all("start", lambda connector: connector.start())
 
     @classmethod
     async def stop_all(cls) -> None:
-        for connector in cls._connectors.values():
-            await connector.stop()
+        await cls._run_all("stop", lambda connector: connector.stop())
+
+    @classmethod
+    async def _run_all(cls, action: str, call: Callable[[Connector], Awaitable[None]]) -> None:
+        """Run ``call`` on every connector concurrently.
+
+        Each failure is logged; the first one is re-raised once all
+        connectors have finished, so one bad connector neither blocks nor
+        hides the others.
+        """
+        connectors = list(cls._connectors.values())
+        results = await asyncio.gather(
+            *(call(connector) for connector in connectors), return_exceptions=True
+        )
+        errors = [
+            (connector, result)
+            for connector, result in zip(connectors, results, strict=True)
+            if isinstance(result, BaseException)
+        ]
+        for connector, error in errors:
+            logger.error("Failed to %s connector %s: %s", action, connector.connector_id, error)
+        if errors:
+            raise errors[0][1]
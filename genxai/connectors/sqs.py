@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from contextlib import AsyncExitStack
 from typing import Any
 
-from .base import Connector
+from genxai.utils.json_codec import loads
+
+from .base import Connector, error_backoff
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +34,21 @@ class SQSConnector(Connector):
         self.wait_time_seconds = wait_time_seconds
         self.max_messages = max_messages
         self._task: asyncio.Task[None] | None = None
-        self._session = None
+        self._session: Any = None
+        self._client: Any = None
+        self._exit_stack: AsyncExitStack | None = None
 
     async def _start(self) -> None:
+        import aioboto3
+
+        # One client for the connector's lifetime: building a botocore client
+        # loads service models and opens a fresh connection pool.
+        if self._session is None:
+            self._session = aioboto3.Session()
+        self._exit_stack = AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(
+            self._session.client("sqs", region_name=self.region)
+        )
         self._task = asyncio.create_task(self._poll_loop())
 
     async def _stop(self) -> None:
@@ -42,25 +56,29 @@ class SQSConnector(Connector):
             self._task.cancel()
             await asyncio.gather(self._task, return_exceptions=True)
             self._task = None
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._client = None
 
     async def validate_config(self) -> None:
         if not self.queue_url:
             raise ValueError("SQS queue_url must be provided")
 
     async def _poll_loop(self) -> None:
+        client = self._client
+        failures = 0
         while True:
             try:
-                if self._session is None:
-                    import aioboto3
-
-                    self._session = aioboto3.Session()
-                async with self._session.client("sqs", region_name=self.region) as client:
-                    response = await client.receive_message(
-                        QueueUrl=self.queue_url,
-                        MaxNumberOfMessages=self.max_messages,
-                        WaitTimeSeconds=self.wait_time_seconds,
-                    )
-                    messages = response.get("Messages", [])
+                response = await client.receive_message(
+                    QueueUrl=self.queue_url,
+                    MaxNumberOfMessages=self.max_messages,
+                    WaitTimeSeconds=self.wait_time_seconds,
+                )
+                failures = 0
+                messages = response.get("Messages", [])
+                processed: list[str] = []
+                try:
                     for message in messages:
                         body = message.get("Body")
                         payload = self._deserialize(body)
@@ -71,22 +89,38 @@ class SQSConnector(Connector):
                                 "receipt_handle": message.get("ReceiptHandle"),
                             },
                         )
-                        await client.delete_message(
-                            QueueUrl=self.queue_url,
-                            ReceiptHandle=message.get("ReceiptHandle"),
-                        )
+                        processed.append(message.get("ReceiptHandle"))
+                finally:
+                    # Acknowledge whatever was emitted, even if a later one failed.
+                    if processed:
+                        await self._delete_batch(client, processed)
             except asyncio.CancelledError:
                 break
             except Exception as exc:
+                failures += 1
                 logger.error("SQS poll error: %s", exc)
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(error_backoff(self.poll_interval, failures))
+
+    async def _delete_batch(self, client: Any, receipt_handles: list[str]) -> None:
+        response = await client.delete_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[
+                {"Id": str(index), "ReceiptHandle": handle}
+                for index, handle in enumerate(receipt_handles)
+            ],
+        )
+        for failure in response.get("Failed", []):
+            # The message becomes visible again after its visibility timeout.
+            logger.warning(
+                "SQS delete failed for entry %s: %s", failure.get("Id"), failure.get("Message")
+            )
 
     def _deserialize(self, body: str | None) -> Any:
         if body is None:
             return None
         try:
-            return json.loads(body)
-        except Exception:
+            return loads(body)
+        except ValueError:
             return body
 
     async def handle_message(self, payload: dict[str, Any]) -> None:
@@ -7,6 +7,8 @@ import hmac
 import logging
 from typing import Any
 
+from genxai.utils.json_codec import loads
+
 from .base import Connector
 
 logger = logging.getLogger(__name__)
@@ -51,9 +53,16 @@ class WebhookConnector(Connector):
         if not signature:
             return False
 
-        digest = hmac.new(self.secret.encode(), payload, getattr(hashlib, self.hash_alg)).hexdigest()
-        expected = f"{self.hash_alg}={digest}"
-        return hmac.compare_digest(expected, signature)
+        alg, sep, hex_signature = signature.partition("=")
+        if not sep or alg != self.hash_alg:
+            return False
+        try:
+            provided = bytes.fromhex(hex_signature)
+        except ValueError:
+            return False
+
+        expected = hmac.digest(self.secret.encode(), payload, self.hash_alg)
+        return hmac.compare_digest(expected, provided)
 
     async def handle_request(
         self,
@@ -71,3 +80,34 @@ class WebhookConnector(Connector):
 
         await self.emit(payload=payload, metadata={"headers": headers})
         return {"status": "accepted", "connector_id": self.connector_id}
+
+    async def handle_raw_request(
+        self,
+        raw_body: bytes,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Verify and decode an unparsed webhook body, then emit it.
+
+        Use this instead of :meth:`handle_request` when the framework hands
+        over the raw body: the signature is checked before any parsing, and
+        the body is decoded once with the shared JSON codec (orjson when
+        installed) rather than by the framework's stdlib parser.
+
+        Args:
+            raw_body: Request body exactly as received
+            headers: Request headers
+
+        Returns:
+            ``{"status": "accepted", ...}`` or ``{"status": "rejected", "reason": ...}``
+        """
+        headers = headers or {}
+        if self.secret and not self.validate_signature(raw_body, headers.get(self.header_name)):
+            logger.warning("Webhook signature validation failed for %s", self.connector_id)
+            return {"status": "rejected", "reason": "invalid signature"}
+        try:
+            payload = loads(raw_body)
+        except ValueError:
+            return {"status": "rejected", "reason": "invalid JSON"}
+
+        await self.emit(payload=payload, metadata={"headers": headers})
+        return {"status": "accepted", "connector_id": self.connector_id}
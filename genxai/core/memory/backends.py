@@ -34,12 +34,14 @@ class MemoryBackendRegistry:
 
     @classmethod
     def create(cls, name: str, **kwargs: Any) -> MemoryBackendPlugin:
-        if name not in cls._factories:
+        try:
+            factory = cls._factories[name]
+        except KeyError:
             raise ValueError(
                 f"Unsupported memory backend plugin: {name}. "
                 f"Supported: {list(cls._factories.keys())}"
-            )
-        return cls._factories[name](**kwargs)
+            ) from None
+        return factory(**kwargs)
 
     @classmethod
     def list_backends(cls) -> list[str]:
@@ -76,9 +78,13 @@ class RedisMemoryBackendPlugin(MemoryBackendPlugin):
         if max_memory in (0, "0"):
             max_memory = None
 
+        # SCAN in batches rather than KEYS: KEYS blocks the server for the whole
+        # keyspace and returns every matching name in one reply.
         key_count: int | None
         try:
-            key_count = len(self._redis.keys(f"{self._key_prefix}*"))
+            key_count = sum(
+                1 for _ in self._redis.scan_iter(match=f"{self._key_prefix}*", count=1000)
+            )
         except Exception:
             key_count = None
 
@@ -98,48 +104,52 @@ class RedisMemoryBackendPlugin(MemoryBackendPlugin):
 
 
 class SqliteMemoryBackendPlugin(MemoryBackendPlugin):
-    """SQLite backend plugin with file and table telemetry."""
+    """SQLite backend plugin with file and table telemetry.
 
-    def __init__(self, sqlite_path: Path | str) -> None:
+    Row counts (``table_rows``) scan every table; pass ``count_rows=False`` to
+    keep ``get_stats`` to file and schema metadata.
+    """
+
+    def __init__(self, sqlite_path: Path | str, count_rows: bool = True) -> None:
         super().__init__(backend="sqlite")
         self._sqlite_path = Path(sqlite_path)
+        self._count_rows_enabled = count_rows
 
     def get_stats(self) -> dict[str, Any]:
+        try:
+            file_size = self._sqlite_path.stat().st_size
+        except OSError:
+            file_size = None
         stats: dict[str, Any] = {
             "backend": self.backend,
             "path": str(self._sqlite_path),
-            "available": self._sqlite_path.exists(),
-            "file_size_bytes": self._sqlite_path.stat().st_size if self._sqlite_path.exists() else 0,
+            "available": file_size is not None,
+            "file_size_bytes": file_size or 0,
         }
-        if not self._sqlite_path.exists():
+        if file_size is None:
             return stats
 
-        conn = sqlite3.connect(self._sqlite_path)
+        # Read-only: stats never create the file or take a write lock.
+        conn = sqlite3.connect(f"{self._sqlite_path.resolve().as_uri()}?mode=ro", uri=True)
         try:
             cursor = conn.cursor()
-            cursor.execute("PRAGMA page_count")
-            page_count = int(cursor.fetchone()[0])
-            cursor.execute("PRAGMA page_size")
-            page_size = int(cursor.fetchone()[0])
+            cursor.execute(
+                "SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()"
+            )
+            db_size = int(cursor.fetchone()[0])
 
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
             table_names = [row[0] for row in cursor.fetchall()]
 
-            table_rows: dict[str, int | None] = {}
-            for table in table_names:
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    table_rows[table] = int(cursor.fetchone()[0])
-                except Exception:
-                    table_rows[table] = None
-
             stats.update(
                 {
-                    "db_size_bytes": page_count * page_size,
+                    "db_size_bytes": db_size,
                     "table_count": len(table_names),
-                    "table_rows": table_rows,
+                    "table_names": table_names,
                 }
             )
+            if self._count_rows_enabled:
+                stats["table_rows"] = self._count_rows(cursor, table_names)
         except Exception as exc:
             stats["error"] = str(exc)
         finally:
@@ -147,6 +157,31 @@ class SqliteMemoryBackendPlugin(MemoryBackendPlugin):
 
         return stats
 
+    @staticmethod
+    def _count_rows(cursor: sqlite3.Cursor, table_names: list[str]) -> dict[str, int | None]:
+        """Count rows of every table in one query, per table if that fails."""
+        if not table_names:
+            return {}
+        quoted = ['"' + name.replace('"', '""') + '"' for name in table_names]
+        try:
+            cursor.execute(" UNION ALL ".join(f"SELECT COUNT(*) FROM {table}" for table in quoted))
+            return {
+                name: int(row[0]) for name, row in zip(table_names, cursor.fetchall(), strict=True)
+            }
+        except sqlite3.Error:
+            pass
+
+        # One unreadable table (e.g. a virtual table whose module isn't loaded)
+        # fails the combined query; fall back so the others are still counted.
+        table_rows: dict[str, int | None] = {}
+        for name, table in zip(table_names, quoted, strict=True):
+            try:
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                table_rows[name] = int(cursor.fetchone()[0])
+            except sqlite3.Error:
+                table_rows[name] = None
+        return table_rows
+
 
 class Neo4jMemoryBackendPlugin(MemoryBackendPlugin):
     """Neo4j backend plugin with graph and traversal telemetry."""
@@ -155,6 +190,16 @@ class Neo4jMemoryBackendPlugin(MemoryBackendPlugin):
         super().__init__(backend="neo4j")
         self._graph_db = graph_db
         self._traversal_depth = traversal_depth
+        # One round trip for all counters. Variable-length bounds can't be
+        # query parameters, so the (integer) depth is inlined.
+        self._stats_query = f"""
+        MATCH (n) WITH count(n) AS node_count
+        OPTIONAL MATCH ()-[r]->() WITH node_count, count(r) AS edge_count
+        OPTIONAL MATCH (start) WITH node_count, edge_count, start LIMIT 1
+        OPTIONAL MATCH p=(start)-[*1..{int(traversal_depth)}]->(m)
+        RETURN node_count, edge_count,
+               count(p) AS traversal_path_count, count(DISTINCT m) AS traversal_reachable_nodes
+        """
 
     def get_stats(self) -> dict[str, Any]:
         stats: dict[str, Any] = {
@@ -167,40 +212,24 @@ class Neo4jMemoryBackendPlugin(MemoryBackendPlugin):
 
         try:
             with self._graph_db.session() as session:
-                node_record = session.run("MATCH (n) RETURN count(n) AS node_count")
-                edge_record = session.run("MATCH ()-[r]->() RETURN count(r) AS edge_count")
+                row = next(iter(session.run(self._stats_query)), None)
 
-                node_row = next(iter(node_record), None)
-                edge_row = next(iter(edge_record), None)
+            node_count = self._record_get(row, "node_count", 0)
+            edge_count = self._record_get(row, "edge_count", 0)
 
-                node_count = self._record_get(node_row, "node_count", 0)
-                edge_count = self._record_get(edge_row, "edge_count", 0)
+            stats["graph_size"] = {
+                "node_count": int(node_count or 0),
+                "edge_count": int(edge_count or 0),
+            }
 
-                stats["graph_size"] = {
-                    "node_count": int(node_count or 0),
-                    "edge_count": int(edge_count or 0),
-                }
+            stats["avg_out_degree"] = (
+                (int(edge_count) / int(node_count)) if node_count not in (None, 0) else 0.0
+            )
 
-                stats["avg_out_degree"] = (
-                    (int(edge_count) / int(node_count))
-                    if node_count not in (None, 0)
-                    else 0.0
-                )
-
-                traversal_query = """
-                MATCH (n)
-                WITH n LIMIT 1
-                OPTIONAL MATCH p=(n)-[*1..$depth]->(m)
-                RETURN count(p) AS traversal_path_count, count(DISTINCT m) AS traversal_reachable_nodes
-                """
-                traversal_record = session.run(traversal_query, depth=self._traversal_depth)
-                traversal_row = next(iter(traversal_record), None)
-                stats["traversal"] = {
-                    "path_count": int(self._record_get(traversal_row, "traversal_path_count", 0) or 0),
-                    "reachable_nodes": int(
-                        self._record_get(traversal_row, "traversal_reachable_nodes", 0) or 0
-                    ),
-                }
+            stats["traversal"] = {
+                "path_count": int(self._record_get(row, "traversal_path_count", 0) or 0),
+                "reachable_nodes": int(self._record_get(row, "traversal_reachable_nodes", 0) or 0),
+            }
         except Exception as exc:
             stats["error"] = str(exc)
 
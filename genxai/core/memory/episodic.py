@@ -1,6 +1,7 @@
 """Episodic memory implementation for storing agent experiences."""
 
-import json
+import asyncio
+import heapq
 import logging
 import uuid
 from datetime import datetime
@@ -9,8 +10,10 @@ from typing import Any
 from genxai.core.memory.backends import MemoryBackendPlugin
 from genxai.core.memory.persistence import (
     MemoryPersistenceConfig,
+    SqliteMemoryStore,
     create_memory_store,
 )
+from genxai.utils.json_codec import dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,19 @@ logger = logging.getLogger(__name__)
 class Episode:
     """Represents a single episode in agent's experience."""
 
+    __slots__ = (
+        "id",
+        "agent_id",
+        "_task",
+        "_task_lower",
+        "actions",
+        "outcome",
+        "timestamp",
+        "duration",
+        "success",
+        "metadata",
+    )
+
     def __init__(
         self,
         id: str,
@@ -53,6 +69,18 @@ class Episode:
         self.success = success
         self.metadata = metadata or {}
 
+    @property
+    def task(self) -> str:
+        """Task description."""
+        return self._task
+
+    @task.setter
+    def task(self, value: str) -> None:
+        # Similarity and pattern queries compare lowercased tasks for every
+        # stored episode; keep the lowercased form alongside the original.
+        self._task = value
+        self._task_lower = value.lower()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert episode to dictionary."""
         return {
@@ -118,6 +146,19 @@ class EpisodicMemory:
 
         # Fallback to in-memory storage
         self._episodes: dict[str, Episode] = {}
+        # Side indexes over _episodes: episode IDs per agent (dict keys, so
+        # they stay in _episodes order), and a min-heap of (timestamp, id) for
+        # eviction. Heap entries whose episode is gone or has a different
+        # timestamp are stale and skipped when popped.
+        self._by_agent: dict[str, dict[str, None]] = {}
+        self._heap: list[tuple[datetime, str]] = []
+
+        # Disk writes run in a worker thread, one at a time. Each mutation bumps
+        # _version; a JSON rewrite that finds a newer snapshot already saved
+        # is skipped, so bursts of writes coalesce.
+        self._persist_lock = asyncio.Lock()
+        self._version = 0
+        self._saved_version = 0
 
         if self._use_graph:
             logger.info("Initialized episodic memory with graph database")
@@ -127,7 +168,7 @@ class EpisodicMemory:
                 "Episodes will not persist across restarts."
             )
 
-        if self._store and self._persistence and self._persistence.enabled:
+        if self._persistence_enabled():
             self._load_from_disk()
 
     async def store_episode(
@@ -166,22 +207,18 @@ class EpisodicMemory:
             metadata=metadata,
         )
 
+        evicted: list[str] = []
         if self._use_graph:
             await self._store_in_graph(episode)
         else:
             # In-memory storage
-            self._episodes[episode.id] = episode
+            self._add_episode(episode)
 
             # Enforce max episodes limit
             if len(self._episodes) > self._max_episodes:
-                # Remove oldest episode
-                oldest_id = min(
-                    self._episodes.keys(),
-                    key=lambda k: self._episodes[k].timestamp
-                )
-                del self._episodes[oldest_id]
+                evicted.append(self._evict_oldest())
 
-        self._persist()
+        await self._persist_episode(episode, evicted)
 
         logger.debug(f"Stored episode {episode.id} for agent {agent_id}")
         return episode
@@ -222,18 +259,13 @@ class EpisodicMemory:
             )
 
         # In-memory retrieval
-        episodes = [
-            ep for ep in self._episodes.values()
-            if ep.agent_id == agent_id
-        ]
+        episodes = self._agent_episodes(agent_id)
 
         if success_only:
             episodes = [ep for ep in episodes if ep.success]
 
-        # Sort by timestamp (most recent first)
-        episodes.sort(key=lambda ep: ep.timestamp, reverse=True)
-
-        return episodes[:limit]
+        # Most recent first
+        return heapq.nlargest(limit, episodes, key=lambda ep: ep.timestamp)
 
     async def retrieve_similar_tasks(
         self,
@@ -253,20 +285,10 @@ class EpisodicMemory:
             return await self._retrieve_similar_from_graph(task, limit)
 
         # Simple in-memory similarity (keyword matching)
-        task_lower = task.lower()
-        episodes = []
-
-        for episode in self._episodes.values():
-            if any(word in episode.task.lower() for word in task_lower.split()):
-                episodes.append(episode)
-
-        # Sort by success and recency
-        episodes.sort(
-            key=lambda ep: (ep.success, ep.timestamp),
-            reverse=True
-        )
+        episodes = self._matching_episodes(task.lower().split())
 
-        return episodes[:limit]
+        # Rank by success and recency
+        return heapq.nlargest(limit, episodes, key=lambda ep: (ep.success, ep.timestamp))
 
     async def get_success_rate(
         self,
@@ -310,17 +332,17 @@ class EpisodicMemory:
             except Exception as exc:
                 logger.warning("Failed graph success-rate query, fallback to in-memory: %s", exc)
 
-        episodes = list(self._episodes.values())
-
         # Apply filters
         if agent_id:
-            episodes = [ep for ep in episodes if ep.agent_id == agent_id]
+            episodes = self._agent_episodes(agent_id)
+        else:
+            episodes = list(self._episodes.values())
 
         if task_pattern:
             pattern_lower = task_pattern.lower()
             episodes = [
                 ep for ep in episodes
-                if pattern_lower in ep.task.lower()
+                if pattern_lower in ep._task_lower
             ]
 
         if not episodes:
@@ -343,31 +365,42 @@ class EpisodicMemory:
         Returns:
             List of patterns with statistics
         """
-        episodes = list(self._episodes.values())
-
         if agent_id:
-            episodes = [ep for ep in episodes if ep.agent_id == agent_id]
+            episodes = self._agent_episodes(agent_id)
+        else:
+            episodes = list(self._episodes.values())
 
-        # Group by task
-        task_groups: dict[str, list[Episode]] = {}
+        # Group by task, accumulating [occurrences, successes, total duration,
+        # last seen] in the same pass
+        task_groups: dict[str, list[Any]] = {}
         for episode in episodes:
-            task_key = episode.task.lower()
-            if task_key not in task_groups:
-                task_groups[task_key] = []
-            task_groups[task_key].append(episode)
+            group = task_groups.get(episode._task_lower)
+            if group is None:
+                task_groups[episode._task_lower] = [
+                    1,
+                    int(episode.success),
+                    episode.duration,
+                    episode.timestamp,
+                ]
+                continue
+            group[0] += 1
+            group[1] += int(episode.success)
+            group[2] += episode.duration
+            if episode.timestamp > group[3]:
+                group[3] = episode.timestamp
 
         # Extract patterns
-        patterns = []
-        for task, task_episodes in task_groups.items():
-            if len(task_episodes) >= min_occurrences:
-                successful = sum(1 for ep in task_episodes if ep.success)
-                patterns.append({
-                    "task": task,
-                    "occurrences": len(task_episodes),
-                    "success_rate": successful / len(task_episodes),
-                    "avg_duration": sum(ep.duration for ep in task_episodes) / len(task_episodes),
-                    "last_seen": max(ep.timestamp for ep in task_episodes).isoformat(),
-                })
+        patterns = [
+            {
+                "task": task,
+                "occurrences": count,
+                "success_rate": successful / count,
+                "avg_duration": duration_sum / count,
+                "last_seen": last_seen.isoformat(),
+            }
+            for task, (count, successful, duration_sum, last_seen) in task_groups.items()
+            if count >= min_occurrences
+        ]
 
         # Sort by occurrences
         patterns.sort(key=lambda p: p["occurrences"], reverse=True)
@@ -382,17 +415,25 @@ class EpisodicMemory:
         """
         if agent_id:
             # Clear specific agent's episodes
-            self._episodes = {
-                k: v for k, v in self._episodes.items()
-                if v.agent_id != agent_id
-            }
+            for episode_id in self._by_agent.pop(agent_id, ()):
+                del self._episodes[episode_id]
+            self._heap = [(ep.timestamp, ep.id) for ep in self._episodes.values()]
+            heapq.heapify(self._heap)
             logger.info(f"Cleared episodes for agent {agent_id}")
         else:
             # Clear all episodes
             self._episodes.clear()
+            self._by_agent.clear()
+            self._heap.clear()
             logger.info("Cleared all episodes")
 
-        self._persist()
+        if not self._persistence_enabled():
+            return
+        if isinstance(self._store, SqliteMemoryStore):
+            async with self._persist_lock:
+                await asyncio.to_thread(self._store.clear_episodes, agent_id)
+        else:
+            await self._persist()
 
     async def get_stats(self) -> dict[str, Any]:
         """Get episodic memory statistics.
@@ -408,42 +449,129 @@ class EpisodicMemory:
                 "backend_telemetry": self._backend_plugin.get_stats() if self._backend_plugin else None,
             }
 
-        episodes = list(self._episodes.values())
-        successful = sum(1 for ep in episodes if ep.success)
+        # One pass over the episodes for every aggregate
+        total = len(self._episodes)
+        successful = 0
+        duration_sum = 0.0
+        oldest = newest = None
+        for ep in self._episodes.values():
+            if ep.success:
+                successful += 1
+            duration_sum += ep.duration
+            if oldest is None or ep.timestamp < oldest:
+                oldest = ep.timestamp
+            if newest is None or ep.timestamp > newest:
+                newest = ep.timestamp
 
         return {
-            "total_episodes": len(episodes),
+            "total_episodes": total,
             "successful_episodes": successful,
-            "failed_episodes": len(episodes) - successful,
-            "success_rate": successful / len(episodes),
-            "avg_duration": sum(ep.duration for ep in episodes) / len(episodes),
-            "unique_agents": len(set(ep.agent_id for ep in episodes)),
-            "oldest_episode": min(ep.timestamp for ep in episodes).isoformat(),
-            "newest_episode": max(ep.timestamp for ep in episodes).isoformat(),
+            "failed_episodes": total - successful,
+            "success_rate": successful / total,
+            "avg_duration": duration_sum / total,
+            "unique_agents": len(self._by_agent),
+            "oldest_episode": oldest.isoformat(),
+            "newest_episode": newest.isoformat(),
             "backend": "graph" if self._use_graph else "in-memory",
             "persistence": bool(self._persistence and self._persistence.enabled),
             "backend_telemetry": self._backend_plugin.get_stats() if self._backend_plugin else None,
         }
 
-    def _persist(self) -> None:
-        if not self._store:
+    def _persistence_enabled(self) -> bool:
+        return bool(self._store and self._persistence and self._persistence.enabled)
+
+    async def _persist(self) -> None:
+        """Rewrite the episode list, unless a newer snapshot was saved meanwhile."""
+        self._version += 1
+        version = self._version
+        async with self._persist_lock:
+            if self._saved_version >= version:
+                return
+            version = self._version
+            items = [ep.to_dict() for ep in self._episodes.values()]
+            await asyncio.to_thread(self._store.save_list, "episodic_memory.json", items)
+            self._saved_version = version
+
+    async def _persist_episode(self, episode: Episode, evicted: list[str]) -> None:
+        """Persist one new episode, writing only its row on the SQLite backend."""
+        if not self._persistence_enabled():
             return
-        self._store.save_list("episodic_memory.json", [ep.to_dict() for ep in self._episodes.values()])
+        if not isinstance(self._store, SqliteMemoryStore):
+            await self._persist()
+            return
+        async with self._persist_lock:
+            await asyncio.to_thread(self._write_episode_rows, episode.to_dict(), evicted)
+
+    def _write_episode_rows(self, item: dict[str, Any], evicted: list[str]) -> None:
+        self._store.upsert_episodes([item])
+        if evicted:
+            self._store.delete_episodes(evicted)
 
     def _load_from_disk(self) -> None:
         if not self._store:
             return
-        data = self._store.load_list("episodic_memory.json")
+        if isinstance(self._store, SqliteMemoryStore):
+            data = self._store.load_episodes(legacy_key="episodic_memory.json")
+        else:
+            data = self._store.load_list("episodic_memory.json")
         if not data:
             return
-        self._episodes = {item["id"]: Episode.from_dict(item) for item in data}
+        for item in data:
+            self._add_episode(Episode.from_dict(item))
+
+    def _add_episode(self, episode: Episode) -> None:
+        """Insert or replace an episode in ``_episodes`` and its side indexes."""
+        previous = self._episodes.get(episode.id)
+        self._episodes[episode.id] = episode
+        if previous is None:
+            self._by_agent.setdefault(episode.agent_id, {})[episode.id] = None
+        elif previous.agent_id != episode.agent_id:
+            # A replaced episode keeps its place in _episodes; rebuild the new
+            # agent's IDs so they follow that order too.
+            self._discard(self._by_agent, previous.agent_id, episode.id)
+            self._by_agent[episode.agent_id] = {
+                episode_id: None
+                for episode_id, ep in self._episodes.items()
+                if ep.agent_id == episode.agent_id
+            }
+        if previous is None or previous.timestamp != episode.timestamp:
+            heapq.heappush(self._heap, (episode.timestamp, episode.id))
+
+    def _evict_oldest(self) -> str:
+        """Remove the episode with the oldest timestamp and return its ID."""
+        while True:
+            timestamp, episode_id = heapq.heappop(self._heap)
+            episode = self._episodes.get(episode_id)
+            if episode is not None and episode.timestamp == timestamp:
+                break
+        del self._episodes[episode_id]
+        self._discard(self._by_agent, episode.agent_id, episode_id)
+        return episode_id
+
+    @staticmethod
+    def _discard(index: dict[str, dict[str, None]], key: str, episode_id: str) -> None:
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.pop(episode_id, None)
+        if not ids:
+            del index[key]
+
+    def _agent_episodes(self, agent_id: str) -> list[Episode]:
+        return [self._episodes[episode_id] for episode_id in self._by_agent.get(agent_id, ())]
+
+    def _matching_episodes(self, keywords: list[str]) -> list[Episode]:
+        """Episodes whose lowercased task contains any of ``keywords``."""
+        return [
+            ep for ep in self._episodes.values() if any(word in ep._task_lower for word in keywords)
+        ]
 
     def _decode_episode_value(self, value: Any, fallback: Any) -> Any:
         if value is None:
             return fallback
         if isinstance(value, str):
             try:
-                return json.loads(value)
+                return loads(value)
             except Exception:
                 return fallback
         return value
@@ -480,7 +608,7 @@ class EpisodicMemory:
             except Exception:
                 continue
             episodes.append(episode)
-            self._episodes[episode.id] = episode
+            self._add_episode(episode)
         return episodes
 
     async def _store_in_graph(self, episode: Episode) -> None:
@@ -503,17 +631,17 @@ class EpisodicMemory:
                     id=episode.id,
                     agent_id=episode.agent_id,
                     task=episode.task,
-                    actions_json=json.dumps(episode.actions, default=str),
-                    outcome_json=json.dumps(episode.outcome, default=str),
+                    actions_json=dumps_bytes(episode.actions).decode(),
+                    outcome_json=dumps_bytes(episode.outcome).decode(),
                     timestamp=episode.timestamp.isoformat(),
                     duration=episode.duration,
                     success=episode.success,
-                    metadata_json=json.dumps(episode.metadata, default=str),
+                    metadata_json=dumps_bytes(episode.metadata).decode(),
                 )
         except Exception as exc:
             logger.warning("Failed graph episode storage, fallback to in-memory: %s", exc)
 
-        self._episodes[episode.id] = episode
+        self._add_episode(episode)
 
     async def _retrieve_from_graph(self, episode_id: str) -> Episode | None:
         """Retrieve episode from graph database."""
@@ -556,11 +684,10 @@ class EpisodicMemory:
         except Exception as exc:
             logger.warning("Failed graph agent query, fallback to in-memory: %s", exc)
 
-        episodes = [ep for ep in self._episodes.values() if ep.agent_id == agent_id]
+        episodes = self._agent_episodes(agent_id)
         if success_only:
             episodes = [ep for ep in episodes if ep.success]
-        episodes.sort(key=lambda ep: ep.timestamp, reverse=True)
-        return episodes[:limit]
+        return heapq.nlargest(limit, episodes, key=lambda ep: ep.timestamp)
 
     async def _retrieve_similar_from_graph(
         self,
@@ -586,13 +713,8 @@ class EpisodicMemory:
         except Exception as exc:
             logger.warning("Failed graph similarity query, fallback to in-memory: %s", exc)
 
-        episodes = [
-            ep
-            for ep in self._episodes.values()
-            if any(word in ep.task.lower() for word in keywords)
-        ]
-        episodes.sort(key=lambda ep: (ep.success, ep.timestamp), reverse=True)
-        return episodes[:limit]
+        episodes = self._matching_episodes(keywords)
+        return heapq.nlargest(limit, episodes, key=lambda ep: (ep.success, ep.timestamp))
 
     def __len__(self) -> int:
         """Get number of stored episodes."""
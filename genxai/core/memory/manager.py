@@ -717,9 +717,12 @@ class MemorySystem:
             "path": str(self._persistence.base_dir),
         }
 
-        stats["backend_plugins"] = {
-            name: plugin.get_stats() for name, plugin in self._backend_plugins.items()
-        }
+        # Plugin stats use blocking clients (Redis, SQLite, Neo4j); collect them
+        # concurrently in worker threads instead of stalling the event loop.
+        plugin_stats = await asyncio.gather(
+            *(asyncio.to_thread(plugin.get_stats) for plugin in self._backend_plugins.values())
+        )
+        stats["backend_plugins"] = dict(zip(self._backend_plugins, plugin_stats, strict=True))
 
         stats["rolling_summary"] = {
             "enabled": self.config.rolling_summary_enabled,
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from genxai.utils.json_codec import dumps_bytes, loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,16 +130,13 @@ class SqliteMemoryStore:
         conn = sqlite3.connect(db_path)
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS memory_blobs (
                     key TEXT PRIMARY KEY,
                     payload TEXT NOT NULL
                 )
-                """
-            )
-            cursor.execute(
-                """
+                """)
+            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS long_term_metadata (
                     memory_id TEXT PRIMARY KEY,
                     memory_type TEXT,
@@ -146,8 +145,21 @@ class SqliteMemoryStore:
                     tags TEXT,
                     metadata TEXT
                 )
-                """
-            )
+                """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS episodes (
+                    id TEXT PRIMARY KEY,
+                    agent_id TEXT NOT NULL,
+                    task TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    success INTEGER NOT NULL,
+                    duration REAL NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                """)
+            # WAL keeps the per-episode writes below cheap: a commit appends to
+            # the log instead of rewriting pages in place.
+            cursor.execute("PRAGMA journal_mode=WAL")
             conn.commit()
             self._initialized = True
         finally:
@@ -155,7 +167,9 @@ class SqliteMemoryStore:
 
     def _get_connection(self) -> sqlite3.Connection:
         self._ensure_db()
-        return sqlite3.connect(self.config.resolve_sqlite_path())
+        conn = sqlite3.connect(self.config.resolve_sqlite_path())
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def load_list(self, filename: str) -> list[dict[str, Any]]:
         if not self.config.enabled:
@@ -290,6 +304,122 @@ class SqliteMemoryStore:
         finally:
             conn.close()
 
+    def upsert_episodes(self, items: Iterable[dict[str, Any]]) -> None:
+        """Insert or replace episode rows, keyed by episode ``id``."""
+        if not self.config.enabled:
+            return
+
+        self._ensure_db()
+        conn = self._get_connection()
+        try:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO episodes
+                (id, agent_id, task, timestamp, success, duration, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [_episode_row(item) for item in items],
+            )
+            conn.commit()
+        except Exception as exc:
+            logger.error("Failed to store episodes: %s", exc)
+        finally:
+            conn.close()
+
+    def delete_episodes(self, episode_ids: Iterable[str]) -> None:
+        """Delete episode rows by ID."""
+        if not self.config.enabled:
+            return
+
+        self._ensure_db()
+        conn = self._get_connection()
+        try:
+            conn.executemany(
+                "DELETE FROM episodes WHERE id = ?",
+                [(episode_id,) for episode_id in episode_ids],
+            )
+            conn.commit()
+        except Exception as exc:
+            logger.error("Failed to delete episodes: %s", exc)
+        finally:
+            conn.close()
+
+    def clear_episodes(self, agent_id: str | None = None) -> None:
+        """Delete all episode rows, or only those of ``agent_id``."""
+        if not self.config.enabled:
+            return
+
+        self._ensure_db()
+        conn = self._get_connection()
+        try:
+            if agent_id:
+                conn.execute("DELETE FROM episodes WHERE agent_id = ?", (agent_id,))
+            else:
+                conn.execute("DELETE FROM episodes")
+            conn.commit()
+        except Exception as exc:
+            logger.error("Failed to clear episodes: %s", exc)
+        finally:
+            conn.close()
+
+    def load_episodes(self, legacy_key: str | None = None) -> list[dict[str, Any]]:
+        """Load episode rows, oldest first.
+
+        Args:
+            legacy_key: ``memory_blobs`` key of a list saved by ``save_list``
+                before episodes had their own table. When the table is empty
+                and the blob exists, its items are moved into the table.
+
+        Returns:
+            Episode dictionaries as produced by ``Episode.to_dict``
+        """
+        if not self.config.enabled:
+            return []
+
+        self._ensure_db()
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute("SELECT payload FROM episodes ORDER BY timestamp, rowid")
+            items = [loads(row[0]) for row in cursor]
+            if items or not legacy_key:
+                return items
+
+            row = conn.execute(
+                "SELECT payload FROM memory_blobs WHERE key = ?", (legacy_key,)
+            ).fetchone()
+            if not row:
+                return []
+            data = json.loads(row[0])
+            items = data if isinstance(data, list) else []
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO episodes
+                    (id, agent_id, task, timestamp, success, duration, payload)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [_episode_row(item) for item in items],
+                )
+                conn.execute("DELETE FROM memory_blobs WHERE key = ?", (legacy_key,))
+            return items
+        except Exception as exc:
+            logger.error("Failed to load episodes from sqlite: %s", exc)
+            return []
+        finally:
+            conn.close()
+
+
+def _episode_row(item: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        item["id"],
+        item["agent_id"],
+        item["task"],
+        item["timestamp"],
+        int(bool(item["success"])),
+        float(item["duration"]),
+        dumps_bytes(item).decode(),
+    )
+
 
 def create_memory_store(config: MemoryPersistenceConfig) -> JsonMemoryStore | SqliteMemoryStore:
     """Factory for memory stores based on config backend."""
@@ -112,7 +112,8 @@ class CacheManager:
             "kwargs": sorted(kwargs.items())
         }
         key_str = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.md5(key_str.encode()).hexdigest()
+        # Non-cryptographic fingerprint: BLAKE2b-128 is faster than MD5, same key length.
+        key_hash = hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
         return f"{prefix}:{key_hash}"
 
     def get(self, key: str) -> Any | None:
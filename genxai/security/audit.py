@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -40,7 +41,10 @@ class AuditStore:
         self._ensure_db()
 
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        # WAL (set once in _ensure_db) keeps a commit durable without a full fsync.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def _with_connection(self, handler):
         conn = self._connect()
@@ -51,6 +55,7 @@ class AuditStore:
 
     def _ensure_db(self) -> None:
         def _init(conn: sqlite3.Connection) -> None:
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -90,19 +95,33 @@ class AuditStore:
             return cursor.fetchall()
 
         rows = self._with_connection(_load)
-        events: list[AuditEvent] = []
-        for action, actor_id, resource_id, status, metadata, timestamp in rows:
-            events.append(
-                AuditEvent(
-                    action=action,
-                    actor_id=actor_id,
-                    resource_id=resource_id,
-                    status=status,
-                    metadata=json.loads(metadata),
-                    timestamp=datetime.fromisoformat(timestamp),
-                )
+        return [self._event_from_row(row) for row in rows]
+
+    def iter_events(self, batch_size: int = 500) -> Iterator[AuditEvent]:
+        """Yield audit events in insertion order without materializing them all."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "SELECT action, actor_id, resource_id, status, metadata, timestamp "
+                "FROM audit_events ORDER BY id"
             )
-        return events
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield self._event_from_row(row)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _event_from_row(row: tuple[Any, ...]) -> AuditEvent:
+        action, actor_id, resource_id, status, metadata, timestamp = row
+        return AuditEvent(
+            action=action,
+            actor_id=actor_id,
+            resource_id=resource_id,
+            status=status,
+            metadata=json.loads(metadata),
+            timestamp=datetime.fromisoformat(timestamp),
+        )
 
     def save_event(self, event: AuditEvent) -> None:
         def _save(conn: sqlite3.Connection) -> None:
@@ -206,6 +225,10 @@ class AuditLog:
         self._events = self._store.load_events()
         return list(self._events)
 
+    def iter_events(self) -> Iterator[AuditEvent]:
+        """Stream persisted events straight from the store."""
+        return self._store.iter_events()
+
     def clear(self) -> None:
         self._events.clear()
         self._store.clear_events()
@@ -259,6 +282,9 @@ class ApprovalService:
     def get(self, request_id: str) -> ApprovalRequest | None:
         return self._requests.get(request_id)
 
+    def list_requests(self) -> list[ApprovalRequest]:
+        return list(self._requests.values())
+
     def clear(self) -> None:
         self._requests.clear()
         self._counter = 0
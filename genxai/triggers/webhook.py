@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import hmac
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 from genxai.triggers.base import BaseTrigger
 
 logger = logging.getLogger(__name__)
 
+# Bodies at least this large are HMAC'd in a worker thread: OpenSSL releases the
+# GIL for big buffers, while small ones are cheaper to verify inline.
+OFFLOAD_SIGNATURE_BYTES = 64 * 1024
+
 
 class WebhookTrigger(BaseTrigger):
     """HTTP webhook trigger.
@@ -26,11 +32,21 @@ class WebhookTrigger(BaseTrigger):
         name: str | None = None,
         header_name: str = "X-GenXAI-Signature",
         hash_alg: str = "sha256",
+        delivery_header: str = "X-GenXAI-Delivery",
+        dedupe_ttl_seconds: float = 86400.0,
+        dedupe_max_entries: int = 100_000,
     ) -> None:
         super().__init__(trigger_id=trigger_id, name=name)
         self.secret = secret
         self.header_name = header_name
         self.hash_alg = hash_alg
+        self.delivery_header = delivery_header
+        self.dedupe_ttl_seconds = dedupe_ttl_seconds
+        self.dedupe_max_entries = dedupe_max_entries
+        # delivery id -> (expires_at, response); insertion order == expiry order.
+        self._deliveries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        # delivery id -> event set once the in-flight emit for it finishes.
+        self._inflight: dict[str, asyncio.Event] = {}
 
     async def _start(self) -> None:
         logger.debug("Webhook trigger %s ready for requests", self.trigger_id)
@@ -45,9 +61,32 @@ class WebhookTrigger(BaseTrigger):
         if not signature:
             return False
 
-        digest = hmac.new(self.secret.encode(), payload, getattr(hashlib, self.hash_alg)).hexdigest()
-        expected = f"{self.hash_alg}={digest}"
-        return hmac.compare_digest(expected, signature)
+        alg, sep, hex_signature = signature.partition("=")
+        if not sep or alg != self.hash_alg:
+            return False
+        try:
+            provided = bytes.fromhex(hex_signature)
+        except ValueError:
+            return False
+
+        expected = hmac.digest(self.secret.encode(), payload, self.hash_alg)
+        return hmac.compare_digest(expected, provided)
+
+    def _cached_delivery(self, delivery_id: str) -> dict[str, Any] | None:
+        """Return the response recorded for an already-processed delivery."""
+        now = time.monotonic()
+        while self._deliveries:
+            oldest_id, (expires_at, _) = next(iter(self._deliveries.items()))
+            if expires_at > now:
+                break
+            del self._deliveries[oldest_id]
+        cached = self._deliveries.get(delivery_id)
+        return dict(cached[1]) if cached else None
+
+    def _record_delivery(self, delivery_id: str, response: dict[str, Any]) -> None:
+        self._deliveries[delivery_id] = (time.monotonic() + self.dedupe_ttl_seconds, response)
+        while len(self._deliveries) > self.dedupe_max_entries:
+            self._deliveries.popitem(last=False)
 
     async def handle_request(
         self,
@@ -60,9 +99,37 @@ class WebhookTrigger(BaseTrigger):
         signature = headers.get(self.header_name)
 
         if self.secret and raw_body is not None:
-            if not self.validate_signature(raw_body, signature):
+            if len(raw_body) >= OFFLOAD_SIGNATURE_BYTES:
+                valid = await asyncio.to_thread(self.validate_signature, raw_body, signature)
+            else:
+                valid = self.validate_signature(raw_body, signature)
+            if not valid:
                 logger.warning("Webhook signature validation failed for %s", self.trigger_id)
                 return {"status": "rejected", "reason": "invalid signature"}
 
-        await self.emit(payload=payload, metadata={"headers": headers})
-        return {"status": "accepted", "trigger_id": self.trigger_id}
+        # Providers retry deliveries; replay the first response instead of re-emitting.
+        delivery_id = headers.get(self.delivery_header) if self.delivery_header else None
+        if not delivery_id:
+            await self.emit(payload=payload, metadata={"headers": headers})
+            return {"status": "accepted", "trigger_id": self.trigger_id}
+
+        while True:
+            cached = self._cached_delivery(delivery_id)
+            if cached is not None:
+                logger.debug("Duplicate webhook delivery %s for %s", delivery_id, self.trigger_id)
+                return cached
+            inflight = self._inflight.get(delivery_id)
+            if inflight is None:
+                break
+            # A concurrent retry is still emitting; wait for its outcome. If it
+            # failed nothing was recorded and this request emits instead.
+            await inflight.wait()
+
+        self._inflight[delivery_id] = asyncio.Event()
+        try:
+            await self.emit(payload=payload, metadata={"headers": headers})
+            response = {"status": "accepted", "trigger_id": self.trigger_id}
+            self._record_delivery(delivery_id, response)
+        finally:
+            self._inflight.pop(delivery_id).set()
+        return dict(response)
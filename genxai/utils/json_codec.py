@@ -0,0 +1,54 @@
+"""JSON encoding helpers that use ``orjson`` when it is installed.
+
+``orjson`` is an optional speedup (``pip install genxai-framework[speedups]``).
+Without it these helpers fall back to the stdlib ``json`` module and produce
+byte-identical output: compact separators (or two-space indentation),
+unescaped UTF-8, datetimes as ISO 8601 strings, dataclasses as objects and
+unknown types via ``str()``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to encode; datetimes and dataclasses are handled natively
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        text = json.dumps(obj, default=_default, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"))
+    return text.encode()
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Deserialize a JSON document from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
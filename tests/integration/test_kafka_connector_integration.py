@@ -22,7 +22,7 @@ async def test_kafka_connector_emits_messages(monkeypatch):
 
     class FakeConsumer:
         def __init__(self, *args, **kwargs):
-            self._value = {"hello": "world"}
+            self._value = b'{"hello": "world"}'
 
         async def start(self):
             return None
@@ -30,9 +30,9 @@ async def test_kafka_connector_emits_messages(monkeypatch):
         async def stop(self):
             return None
 
-        async def getone(self):
+        async def getmany(self, timeout_ms=0, max_records=None):
             await asyncio.sleep(0)
-            return FakeMessage(self._value)
+            return {("topic", 0): [FakeMessage(self._value)]}
 
     fake_module = types.SimpleNamespace(AIOKafkaConsumer=FakeConsumer)
     sys.modules["aiokafka"] = fake_module
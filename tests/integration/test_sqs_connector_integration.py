@@ -20,8 +20,8 @@ async def test_sqs_connector_emits_messages(monkeypatch):
         async def receive_message(self, **kwargs):
             return {"Messages": [{"Body": "{\"ok\": true}", "MessageId": "1", "ReceiptHandle": "r1"}]}
 
-        async def delete_message(self, **kwargs):
-            return None
+        async def delete_message_batch(self, **kwargs):
+            return {"Successful": [{"Id": e["Id"]} for e in kwargs["Entries"]]}
 
     class FakeSession:
         def client(self, *args, **kwargs):
@@ -0,0 +1,36 @@
+"""Tests for the observability API app."""
+
+import httpx
+import pytest
+
+pytest.importorskip("fastapi")
+
+from genxai.api import create_app
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Build the ASGI app once and share it across tests in this module."""
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_text(client):
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+
+@pytest.mark.asyncio
+async def test_unknown_route_returns_404(client):
+    response = await client.get("/missing")
+
+    assert response.status_code == 404
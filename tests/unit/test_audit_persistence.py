@@ -32,4 +32,15 @@ def test_audit_persistence(tmp_path, monkeypatch):
     assert approval_service.get(approval.request_id) is not None
 
     reset_audit_services()
-    os.environ.pop("GENXAI_AUDIT_DB", None)
\ No newline at end of file
+    os.environ.pop("GENXAI_AUDIT_DB", None)
+
+
+def test_audit_store_uses_wal_journal(tmp_path):
+    from genxai.security.audit import AuditStore
+
+    store = AuditStore(tmp_path / "audit.db")
+    conn = store._connect()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
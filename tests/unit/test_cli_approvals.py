@@ -21,4 +21,16 @@ def test_cli_submit_and_approve():
     assert result.exit_code == 0
 
     result = runner.invoke(approval, ["clear"])
-    assert result.exit_code == 0
\ No newline at end of file
+    assert result.exit_code == 0
+
+
+def test_cli_list_approvals():
+    runner = CliRunner()
+    result = runner.invoke(approval, ["list"])
+    assert result.exit_code == 0
+    assert "No approval requests found" in result.output
+
+    get_approval_service().submit("tool.execute", "tool:x", "alice")
+    result = runner.invoke(approval, ["list"])
+    assert result.exit_code == 0
+    assert "approval_1" in result.output
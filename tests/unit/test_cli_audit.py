@@ -40,9 +40,30 @@ def test_cli_audit_list_export_clear(tmp_path):
     )
     assert result.exit_code == 0
     assert csv_path.exists()
+    rows = csv_path.read_text(encoding="utf-8").splitlines()
+    assert rows[0] == "action,actor_id,resource_id,status,timestamp"
+    assert rows[1].startswith("tool.execute,alice,tool:x,success,")
+
+    ndjson_path = tmp_path / "audit.ndjson"
+    result = runner.invoke(
+        audit,
+        ["export", "--output", str(ndjson_path), "--format", "ndjson"],
+    )
+    assert result.exit_code == 0
+    lines = ndjson_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["actor_id"] for line in lines] == ["alice"]
+    assert json.loads(export_path.read_text(encoding="utf-8"))[0]["actor_id"] == "alice"
 
     result = runner.invoke(audit, ["clear"])
     assert result.exit_code == 0
 
+    result = runner.invoke(audit, ["list", "--format", "json"])
+    assert result.exit_code == 0
+    assert "No audit events found" in result.output
+
+    result = runner.invoke(audit, ["export", "--output", str(export_path)])
+    assert result.exit_code == 0
+    assert json.loads(export_path.read_text(encoding="utf-8")) == []
+
     result = runner.invoke(audit, ["compact"])
     assert result.exit_code == 0
\ No newline at end of file
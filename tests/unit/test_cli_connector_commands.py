@@ -71,6 +71,62 @@ def test_connector_validate_start_stop_health(monkeypatch) -> None:
     monkeypatch.delitem(CONNECTOR_CATALOG, "dummy")
 
 
+def test_connector_catalog_overrides_are_picked_up(monkeypatch) -> None:
+    runner = CliRunner()
+    config = '{"required_value": "ok"}'
+    for required in (["required_value"], ["required_value", "other"]):
+        monkeypatch.setitem(
+            CONNECTOR_CATALOG,
+            "dummy",
+            {"class": DummyConnector, "required": required, "description": "Dummy"},
+        )
+        result = runner.invoke(connector_group, ["validate", "--type", "dummy", "--config", config])
+
+    assert result.exit_code != 0
+    assert "missing required fields: other" in result.output.lower()
+
+
+def test_connector_required_fields_follow_in_place_catalog_edits(monkeypatch) -> None:
+    runner = CliRunner()
+    meta = {"class": DummyConnector, "required": ["required_value"], "description": "Dummy"}
+    monkeypatch.setitem(CONNECTOR_CATALOG, "dummy", meta)
+    args = ["validate", "--type", "dummy", "--config", '{"required_value": "ok"}']
+    assert runner.invoke(connector_group, args).exit_code == 0
+
+    meta["required"] = ["zeta", "required_value", "alpha"]
+    result = runner.invoke(connector_group, args)
+
+    assert result.exit_code != 0
+    assert "missing required fields: zeta, alpha" in result.output.lower()
+
+def test_connector_list_json_reflects_catalog_changes(monkeypatch) -> None:
+    runner = CliRunner()
+    first = runner.invoke(connector_group, ["list", "--format", "json"])
+    assert runner.invoke(connector_group, ["list", "--format", "json"]).output == first.output
+    assert "dummy" not in first.output
+
+    monkeypatch.setitem(
+        CONNECTOR_CATALOG,
+        "dummy",
+        {"class": DummyConnector, "required": [], "description": "Dummy"},
+    )
+    updated = runner.invoke(connector_group, ["list", "--format", "json"])
+    assert '"dummy"' in updated.output
+
+    monkeypatch.setitem(CONNECTOR_CATALOG["slack"], "description", "Edited in place")
+    edited = runner.invoke(connector_group, ["list", "--format", "json"])
+    assert "Edited in place" in edited.output
+
+
+def test_connector_invalid_config_json_is_reported() -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        connector_group, ["validate", "--type", "slack", "--config", "{not json"]
+    )
+    assert result.exit_code != 0
+    assert "--config is not valid json" in result.output.lower()
+
+
 def test_connector_error_cases() -> None:
     runner = CliRunner()
     bad_type = runner.invoke(connector_group, ["validate", "--type", "missing"])
@@ -123,4 +179,4 @@ def test_connector_keygen_missing_dependency(monkeypatch) -> None:
 
     result = runner.invoke(connector_group, ["keygen"])
     assert result.exit_code != 0
-    assert "cryptography is required" in result.output.lower()
\ No newline at end of file
+    assert "cryptography is required" in result.output.lower()
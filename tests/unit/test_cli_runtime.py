@@ -0,0 +1,42 @@
+"""Tests for the shared CLI event loop."""
+
+from __future__ import annotations
+
+import asyncio
+
+from genxai.cli.commands import _runtime
+from genxai.cli.commands._runtime import run_async
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_run_async_reuses_one_event_loop() -> None:
+    assert run_async(_current_loop()) is run_async(_current_loop())
+
+
+def test_run_async_cancels_leftover_tasks() -> None:
+    started = []
+
+    async def _leave_task_behind() -> asyncio.Task:
+        async def _forever() -> None:
+            started.append(True)
+            await asyncio.Event().wait()
+
+        task = asyncio.create_task(_forever())
+        await asyncio.sleep(0)
+        return task
+
+    task = run_async(_leave_task_behind())
+
+    assert started == [True]
+    assert task.cancelled()
+
+
+def test_close_loop_allows_a_fresh_loop() -> None:
+    first = run_async(_current_loop())
+    _runtime._close_loop()
+
+    assert first.is_closed()
+    assert run_async(_current_loop()) is not first
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 
 import pytest
@@ -31,6 +33,34 @@ def test_config_store_save_get_delete(tmp_path: Path) -> None:
     assert store.get("slack_alerts") is None
 
 
+def test_config_store_write_failure_keeps_previous_file(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / "configs.json"
+    store = ConnectorConfigStore(path=path)
+    store.save(ConnectorConfigEntry(name="a", connector_type="slack", config={}))
+    before = path.read_bytes()
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("genxai.connectors.config_store.os.replace", _fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        store.save(ConnectorConfigEntry(name="b", connector_type="slack", config={}))
+
+    assert path.read_bytes() == before
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_config_store_write_preserves_file_mode(tmp_path: Path) -> None:
+    path = tmp_path / "configs.json"
+    store = ConnectorConfigStore(path=path)
+    store.save(ConnectorConfigEntry(name="a", connector_type="slack", config={}))
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    path.chmod(0o640)
+    store.save(ConnectorConfigEntry(name="b", connector_type="slack", config={}))
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
 def test_config_store_encryption_roundtrip(monkeypatch, tmp_path: Path) -> None:
     store = ConnectorConfigStore(path=tmp_path / "configs.json", encryption_key="dummy")
 
@@ -49,4 +79,58 @@ def test_config_store_encryption_roundtrip(monkeypatch, tmp_path: Path) -> None:
 
     fetched = store.get("slack_alerts")
     assert fetched is not None
-    assert fetched.config["bot_token"] == "xoxb"
\ No newline at end of file
+    assert fetched.config["bot_token"] == "xoxb"
+
+
+def test_config_store_reuses_decrypted_contents_until_file_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    path = tmp_path / "configs.json"
+    store = ConnectorConfigStore(path=path, encryption_key="dummy")
+    decrypt_calls = []
+
+    def fake_decrypt(payload: str) -> str:
+        decrypt_calls.append(payload)
+        return payload
+
+    monkeypatch.setattr(store, "_encrypt", lambda payload: payload)
+    monkeypatch.setattr(store, "_decrypt", fake_decrypt)
+
+    store.save(ConnectorConfigEntry(name="a", connector_type="slack", config={"bot_token": "x"}))
+    store.get("a")
+    entry = store.get("a")
+    assert entry is not None
+    assert len(decrypt_calls) == 1
+
+    # Mutating a returned entry must not leak into later reads.
+    entry.config["bot_token"] = "changed"
+    assert store.get("a").config["bot_token"] == "x"
+
+    store.save(ConnectorConfigEntry(name="b", connector_type="github", config={"token": "t"}))
+    assert set(store.list()) == {"a", "b"}
+    assert len(decrypt_calls) == 2
+
+
+def test_config_store_builds_fernet_once(monkeypatch, tmp_path: Path) -> None:
+    from genxai.connectors import config_store as config_store_module
+
+    instances = []
+
+    class FakeFernet:
+        def __init__(self, key: bytes) -> None:
+            instances.append(key)
+
+        def encrypt(self, data: bytes) -> bytes:
+            return data[::-1]
+
+        def decrypt(self, data: bytes) -> bytes:
+            return data[::-1]
+
+    monkeypatch.setattr(config_store_module, "_FERNET_CLASS", FakeFernet)
+    store = ConnectorConfigStore(path=tmp_path / "configs.json", encryption_key="k1")
+    for name in ("a", "b", "c"):
+        store.save(ConnectorConfigEntry(name=name, connector_type="slack", config={}))
+
+    reloaded = ConnectorConfigStore(path=tmp_path / "configs.json", encryption_key="k1")
+    assert set(reloaded.list()) == {"a", "b", "c"}
+    assert instances == [b"k1", b"k1"]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Any, Dict, Optional
 
+import httpx
 import pytest
 
 from genxai.connectors.slack import SlackConnector
@@ -16,6 +19,9 @@ from genxai.connectors.google_workspace import GoogleWorkspaceConnector
 class FakeResponse:
     def __init__(self, payload: Dict[str, Any]) -> None:
         self._payload = payload
+        self.content = json.dumps(payload).encode()
+        self.status_code = 200
+        self.headers: Dict[str, str] = {}
 
     def raise_for_status(self) -> None:
         return None
@@ -30,7 +36,12 @@ class FakeClient:
         self.requests: list[Dict[str, Any]] = []
         self.closed = False
 
-    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> FakeResponse:
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FakeResponse:
         self.requests.append({"method": "GET", "path": path, "params": params or {}})
         return FakeResponse(self.responses.get(("GET", path), {}))
 
@@ -277,4 +288,140 @@ async def test_connector_validate_config_errors() -> None:
     with pytest.raises(ValueError):
         await JiraConnector(connector_id="jira", email="a@b.com", api_token="token", base_url="").validate_config()
     with pytest.raises(ValueError):
-        await GoogleWorkspaceConnector(connector_id="gws", access_token="").validate_config()
\ No newline at end of file
+        await GoogleWorkspaceConnector(connector_id="gws", access_token="").validate_config()
+
+@pytest.mark.asyncio
+async def test_rest_connectors_use_shared_pool_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    from genxai.connectors._http import CONNECTOR_HTTP_LIMITS, HTTP2_AVAILABLE
+
+    captured: list[Dict[str, Any]] = []
+
+    def fake_async_client(**kwargs: Any) -> FakeClient:
+        captured.append(kwargs)
+        return FakeClient({})
+
+    monkeypatch.setattr("genxai.connectors._http.httpx.AsyncClient", fake_async_client)
+
+    connector = GitHubConnector(connector_id="github", token="token")
+    await connector.start()
+
+    assert captured[0]["limits"] is CONNECTOR_HTTP_LIMITS
+    assert captured[0]["http2"] is HTTP2_AVAILABLE
+    assert captured[0]["base_url"] == "https://api.github.com"
+    assert captured[0]["headers"]["Authorization"] == "Bearer token"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_build_one_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    created: list[FakeClient] = []
+
+    def fake_async_client(**_: Any) -> FakeClient:
+        created.append(FakeClient({}))
+        return created[-1]
+
+    monkeypatch.setattr("genxai.connectors._http.httpx.AsyncClient", fake_async_client)
+
+    connector = NotionConnector(connector_id="notion", token="token")
+    await asyncio.gather(*(connector.get_page(f"page-{i}") for i in range(5)))
+
+    assert len(created) == 1
+    assert len(created[0].requests) == 5
+
+
+@pytest.mark.asyncio
+async def test_github_iter_all_issues_fetches_remaining_pages_concurrently() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        page = int(request.url.params["page"])
+        assert request.url.params["per_page"] == "100"
+        headers = {}
+        if page == 1:
+            last = "https://api.github.com/repos/octo/demo/issues?page=4&per_page=100"
+            headers["Link"] = f'<{last}>; rel="last"'
+        else:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        return httpx.Response(200, json=[{"number": page}], headers=headers)
+
+    connector = GitHubConnector(connector_id="gh", token="token")
+    connector._client = httpx.AsyncClient(
+        base_url=connector.base_url, transport=httpx.MockTransport(handler)
+    )
+    issues = [issue async for issue in connector.iter_all_issues("octo", "demo", concurrency=2)]
+    await connector.stop()
+
+    assert [issue["number"] for issue in issues] == [1, 2, 3, 4]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_google_workspace_iter_drive_files_follows_page_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pages = {
+        None: {"files": [{"id": "a"}], "nextPageToken": "t1"},
+        "t1": {"files": [{"id": "b"}]},
+    }
+    requested: list[Optional[str]] = []
+
+    async def fake_get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        token = (params or {}).get("pageToken")
+        requested.append(token)
+        return pages[token]
+
+    connector = GoogleWorkspaceConnector(connector_id="gw", access_token="token")
+    monkeypatch.setattr(connector, "_get", fake_get)
+
+    seen = []
+    async for item in connector.iter_drive_files():
+        # Yield to the loop once: the next page was scheduled before this item.
+        await asyncio.sleep(0)
+        seen.append((item["id"], list(requested)))
+
+    assert seen == [("a", [None, "t1"]), ("b", [None, "t1"])]
+
+
+@pytest.mark.asyncio
+async def test_rest_connectors_decode_bodies_with_shared_codec(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def no_stdlib_json(self: httpx.Response, **kwargs: Any) -> Any:
+        raise AssertionError("response.json() should not be used")
+
+    monkeypatch.setattr(httpx.Response, "json", no_stdlib_json)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "p1"}))
+
+    connector = NotionConnector(connector_id="notion", token="token")
+    connector._client = httpx.AsyncClient(base_url=connector.base_url, transport=transport)
+    assert await connector.get_page("p1") == {"id": "p1"}
+    await connector.stop()
+
+
+@pytest.mark.asyncio
+async def test_github_get_revalidates_cached_bodies_with_etags() -> None:
+    seen_etags: list[Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"name": "demo"}, headers={"ETag": '"v1"'})
+
+    connector = GitHubConnector(connector_id="gh", token="token")
+    connector._client = httpx.AsyncClient(
+        base_url=connector.base_url, transport=httpx.MockTransport(handler)
+    )
+    first = await connector.get_repo("octo", "demo")
+    first["name"] = "mutated"
+    second = await connector.get_repo("octo", "demo")
+    await connector.stop()
+
+    assert seen_etags == [None, '"v1"']
+    assert second == {"name": "demo"}
@@ -1,5 +1,7 @@
 """Unit tests for connector registry lifecycle helpers."""
 
+import asyncio
+
 import pytest
 
 from genxai.connectors.base import Connector
@@ -30,4 +32,42 @@ async def test_connector_registry_start_stop_all():
     await ConnectorRegistry.stop_all()
     assert connector.stopped is True
 
-    ConnectorRegistry.unregister("dummy")
\ No newline at end of file
+    ConnectorRegistry.unregister("dummy")
+
+
+class SlowConnector(Connector):
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, connector_id: str, fail: bool = False) -> None:
+        super().__init__(connector_id=connector_id)
+        self.fail = fail
+        self.started = False
+
+    async def _start(self) -> None:
+        SlowConnector.in_flight += 1
+        SlowConnector.peak = max(SlowConnector.peak, SlowConnector.in_flight)
+        await asyncio.sleep(0.01)
+        SlowConnector.in_flight -= 1
+        if self.fail:
+            raise RuntimeError(f"{self.connector_id} failed")
+        self.started = True
+
+    async def _stop(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_connector_registry_starts_connectors_concurrently():
+    connectors = [SlowConnector(f"slow-{i}", fail=i == 0) for i in range(3)]
+    for connector in connectors:
+        ConnectorRegistry.register(connector)
+    try:
+        with pytest.raises(RuntimeError, match="slow-0 failed"):
+            await ConnectorRegistry.start_all()
+        assert SlowConnector.peak == 3
+        assert [c.started for c in connectors] == [False, True, True]
+    finally:
+        await ConnectorRegistry.stop_all()
+        for connector in connectors:
+            ConnectorRegistry.unregister(connector.connector_id)
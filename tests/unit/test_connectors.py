@@ -6,6 +6,7 @@ import hmac
 import json
 import sys
 import types
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
@@ -26,6 +27,8 @@ from genxai.connectors import (
     SQSConnector,
     WebhookConnector,
 )
+from genxai.connectors import webhook as webhook_module
+from genxai.connectors.base import ERROR_BACKOFF_MAX_SECONDS, error_backoff
 from genxai.connectors.config_store import ConnectorConfigEntry, ConnectorConfigStore
 
 
@@ -73,8 +76,11 @@ def test_connector_event_defaults():
 @pytest.mark.asyncio
 async def test_lifecycle_and_health_check():
     connector = DummyConnector("c1")
+    assert connector.last_healthcheck is None
     health = await connector.health_check()
     assert health["status"] == "not_running"
+    checked_at = datetime.fromisoformat(connector.last_healthcheck)
+    assert abs((datetime.now(UTC) - checked_at).total_seconds()) < 60
 
     await connector.start()
     assert connector.status == ConnectorStatus.RUNNING
@@ -120,6 +126,27 @@ async def test_emit_delivers_to_callbacks():
     assert received == [{"x": 1}, {"y": 2}]
 
 
+@pytest.mark.asyncio
+async def test_emit_callback_error_propagates_for_single_and_multiple_subscribers():
+    connector = DummyConnector("c1")
+    received = []
+
+    async def failing(event):
+        raise RuntimeError("boom")
+
+    async def ok(event):
+        received.append(event.payload)
+
+    connector.on_event(failing)
+    with pytest.raises(RuntimeError, match="boom"):
+        await connector.emit(payload={"x": 1})
+
+    connector.on_event(ok)
+    with pytest.raises(RuntimeError, match="boom"):
+        await connector.emit(payload={"y": 2})
+    assert received == [{"y": 2}]
+
+
 @pytest.mark.asyncio
 async def test_emit_without_subscribers_is_noop():
     connector = DummyConnector("c1")
@@ -191,6 +218,49 @@ async def test_webhook_connector_accept_and_reject():
     assert len(received) == 1
 
 
+def test_webhook_connector_signature_formats():
+    connector = WebhookConnector("wh", secret="s3cret")
+    body = b'{"a": 1}'
+    signature = _sign("s3cret", body)
+    hex_digest = signature.partition("=")[2]
+
+    assert connector.validate_signature(body, signature)
+    assert connector.validate_signature(body, "sha256=" + hex_digest.upper())
+    assert not connector.validate_signature(body, "sha1=" + hex_digest)
+    assert not connector.validate_signature(body, hex_digest)
+    assert not connector.validate_signature(body, "sha256=not-hex")
+    assert not connector.validate_signature(body, None)
+
+
+@pytest.mark.asyncio
+async def test_webhook_connector_handle_raw_request(monkeypatch):
+    connector = WebhookConnector("wh", secret="s3cret")
+    received = []
+
+    async def cb(event):
+        received.append(event.payload)
+
+    connector.on_event(cb)
+    decoded = []
+    real_loads = webhook_module.loads
+    monkeypatch.setattr(webhook_module, "loads", lambda raw: decoded.append(raw) or real_loads(raw))
+    body = b'{"a": 1}'
+
+    bad = await connector.handle_raw_request(body, {"X-GenXAI-Signature": "sha256=00"})
+    assert bad == {"status": "rejected", "reason": "invalid signature"}
+    assert decoded == []  # rejected before parsing
+
+    ok = await connector.handle_raw_request(body, {"X-GenXAI-Signature": _sign("s3cret", body)})
+    assert ok == {"status": "accepted", "connector_id": "wh"}
+    assert received == [{"a": 1}]
+
+    junk = b"not json"
+    invalid = await connector.handle_raw_request(
+        junk, {"X-GenXAI-Signature": _sign("s3cret", junk)}
+    )
+    assert invalid == {"status": "rejected", "reason": "invalid JSON"}
+
+
 # ---------------------------------------------------------------- slack
 
 
@@ -354,6 +424,14 @@ async def test_google_workspace_connector_sheet_and_validation():
         await GoogleWorkspaceConnector("gws", access_token="").validate_config()
 
 
+def test_error_backoff_doubles_with_jitter_up_to_cap(monkeypatch):
+    monkeypatch.setattr("genxai.connectors.base.random.uniform", lambda low, high: high)
+    assert error_backoff(1.0, 1) == pytest.approx(1.1)
+    assert error_backoff(1.0, 3) == pytest.approx(4.4)
+    assert error_backoff(0, 1) == pytest.approx(0.11)  # zero poll interval still waits
+    assert error_backoff(1.0, 10_000) == pytest.approx(ERROR_BACKOFF_MAX_SECONDS * 1.1)
+
+
 # ---------------------------------------------------------------- kafka
 
 
@@ -361,9 +439,13 @@ async def test_google_workspace_connector_sheet_and_validation():
 async def test_kafka_connector_consumes_and_emits(monkeypatch):
     messages = [
         types.SimpleNamespace(
-            value={"order": 1}, topic="orders", partition=0, offset=5, timestamp=1234
-        )
+            value=b'{"order": 1}', topic="orders", partition=0, offset=5, timestamp=1234
+        ),
+        types.SimpleNamespace(
+            value=b'{"order": 2}', topic="orders", partition=1, offset=9, timestamp=1235
+        ),
     ]
+    fetches = []
 
     class FakeConsumer:
         def __init__(self, *args, **kwargs):
@@ -376,9 +458,11 @@ async def test_kafka_connector_consumes_and_emits(monkeypatch):
         async def stop(self):
             pass
 
-        async def getone(self):
+        async def getmany(self, timeout_ms=0, max_records=None):
+            fetches.append(max_records)
             if self._messages:
-                return self._messages.pop(0)
+                batch, self._messages = self._messages, []
+                return {("orders", msg.partition): [msg] for msg in batch}
             await asyncio.sleep(3600)  # block until cancelled
 
     fake_aiokafka = types.ModuleType("aiokafka")
@@ -395,20 +479,80 @@ async def test_kafka_connector_consumes_and_emits(monkeypatch):
     await connector.start()
     try:
         for _ in range(100):
-            if received:
+            if len(received) == 2:
                 break
             await asyncio.sleep(0.01)
     finally:
         await connector.stop()
 
-    assert received[0].payload == {"order": 1}
+    assert [event.payload for event in received] == [{"order": 1}, {"order": 2}]
     assert received[0].metadata["topic"] == "orders"
     assert received[0].metadata["offset"] == 5
+    assert received[1].metadata["partition"] == 1
+    # Both partitions came back from one getmany call capped at FETCH_MAX_RECORDS.
+    assert fetches[0] == 500
     assert connector.status == ConnectorStatus.STOPPED
 
 
 @pytest.mark.asyncio
-async def test_kafka_connector_validation_and_deserializer():
+async def test_kafka_connector_keeps_emitting_after_a_failed_record(monkeypatch):
+    records = {
+        ("orders", 0): [
+            types.SimpleNamespace(
+                value=b'{"n": %d}' % n, topic="orders", partition=0, offset=n, timestamp=0
+            )
+            for n in range(3)
+        ],
+        ("orders", 1): [
+            types.SimpleNamespace(
+                value=b'{"n": %d}' % n, topic="orders", partition=1, offset=n, timestamp=0
+            )
+            for n in range(3, 5)
+        ],
+    }
+
+    class FakeConsumer:
+        def __init__(self, *args, **kwargs):
+            self._batches = [records]
+
+        async def start(self):
+            pass
+
+        async def stop(self):
+            pass
+
+        async def getmany(self, timeout_ms=0, max_records=None):
+            if self._batches:
+                return self._batches.pop()
+            await asyncio.sleep(3600)  # block until cancelled
+
+    fake_aiokafka = types.ModuleType("aiokafka")
+    fake_aiokafka.AIOKafkaConsumer = FakeConsumer
+    monkeypatch.setitem(sys.modules, "aiokafka", fake_aiokafka)
+
+    connector = KafkaConnector("kafka", topic="orders", bootstrap_servers="localhost:9092")
+    received = []
+
+    async def cb(event):
+        if event.payload["n"] == 1:
+            raise RuntimeError("subscriber failed")
+        received.append(event.payload["n"])
+
+    connector.on_event(cb)
+    await connector.start()
+    try:
+        for _ in range(100):
+            if len(received) == 4:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await connector.stop()
+
+    assert received == [0, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_kafka_connector_validation_and_deserializer(monkeypatch):
     with pytest.raises(ValueError, match="topic"):
         await KafkaConnector("k", topic="", bootstrap_servers="x").validate_config()
     with pytest.raises(ValueError, match="bootstrap_servers"):
@@ -418,6 +562,14 @@ async def test_kafka_connector_validation_and_deserializer():
     assert connector._default_deserializer(b'{"a": 1}') == {"a": 1}
     assert connector._default_deserializer(b"\xff\xfe") == b"\xff\xfe"  # non-JSON passthrough
 
+    def broken_loads(raw):
+        raise RuntimeError("codec bug")
+
+    monkeypatch.setattr("genxai.connectors.kafka.loads", broken_loads)
+    with pytest.raises(RuntimeError, match="codec bug"):  # only decode errors are swallowed
+        connector._default_deserializer(b"{}")
+    monkeypatch.undo()
+
     received = []
 
     async def cb(event):
@@ -428,6 +580,30 @@ async def test_kafka_connector_validation_and_deserializer():
     assert received == [{"manual": True}]
 
 
+@pytest.mark.asyncio
+async def test_kafka_connector_decodes_large_batches_off_the_loop(monkeypatch):
+    from genxai.connectors import kafka as kafka_module
+
+    offloaded = []
+    real_to_thread = asyncio.to_thread
+
+    async def spy_to_thread(func, *args):
+        offloaded.append(func)
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr(kafka_module.asyncio, "to_thread", spy_to_thread)
+    monkeypatch.setattr(kafka_module, "OFFLOAD_DECODE_BYTES", 16)
+    connector = KafkaConnector("k", topic="t", bootstrap_servers="x")
+
+    small = [types.SimpleNamespace(value=b"{}")]
+    assert await connector._decode_batch(small) == [{}]
+    assert offloaded == []
+
+    large = [types.SimpleNamespace(value=b'{"a": 1}'), types.SimpleNamespace(value=None)] * 2
+    assert await connector._decode_batch(large) == [{"a": 1}, None, {"a": 1}, None]
+    assert offloaded == [connector._decode_values]
+
+
 # ---------------------------------------------------------------- sqs
 
 
@@ -437,7 +613,7 @@ async def test_sqs_connector_polls_and_deletes(monkeypatch):
 
     class FakeSQSClient:
         def __init__(self):
-            self._delivered = False
+            self.polls = 0
 
         async def __aenter__(self):
             return self
@@ -446,26 +622,37 @@ async def test_sqs_connector_polls_and_deletes(monkeypatch):
             return False
 
         async def receive_message(self, **kwargs):
-            if not self._delivered:
-                self._delivered = True
+            self.polls += 1
+            if self.polls == 1:
+                return {"Messages": []}  # an empty long poll first
+            if self.polls == 2:
                 return {
                     "Messages": [
                         {
                             "Body": '{"job": 9}',
                             "MessageId": "m-1",
                             "ReceiptHandle": "rh-1",
-                        }
+                        },
+                        {
+                            "Body": '{"job": 10}',
+                            "MessageId": "m-2",
+                            "ReceiptHandle": "rh-2",
+                        },
                     ]
                 }
             await asyncio.sleep(3600)
 
-        async def delete_message(self, **kwargs):
-            deleted.append(kwargs["ReceiptHandle"])
+        async def delete_message_batch(self, **kwargs):
+            deleted.append([entry["ReceiptHandle"] for entry in kwargs["Entries"]])
+            return {"Successful": kwargs["Entries"], "Failed": []}
 
     fake_client = FakeSQSClient()
 
+    clients_built = []
+
     class FakeSession:
         def client(self, service, region_name=None):
+            clients_built.append(service)
             return fake_client
 
     fake_aioboto3 = types.ModuleType("aioboto3")
@@ -482,7 +669,7 @@ async def test_sqs_connector_polls_and_deletes(monkeypatch):
     await connector.start()
     try:
         for _ in range(100):
-            if received:
+            if deleted:
                 break
             await asyncio.sleep(0.01)
     finally:
@@ -490,7 +677,11 @@ async def test_sqs_connector_polls_and_deletes(monkeypatch):
 
     assert received[0].payload == {"job": 9}
     assert received[0].metadata["message_id"] == "m-1"
-    assert deleted == ["rh-1"]
+    assert received[1].payload == {"job": 10}
+    # Both receipts are acknowledged in a single DeleteMessageBatch call.
+    assert deleted == [["rh-1", "rh-2"]]
+    # Several receive cycles ran through one client built at start.
+    assert clients_built == ["sqs"]
 
 
 @pytest.mark.asyncio
@@ -517,6 +708,56 @@ async def test_postgres_cdc_validation():
         await PostgresCDCConnector("pg", dsn="d", slot_name="s", publication="").validate_config()
 
 
+@pytest.mark.asyncio
+async def test_postgres_cdc_guards_slot_creation_and_drains_backlog(monkeypatch):
+    queries = []
+    batches = [[{"data": '{"n": 1}'}], [{"data": '{"n": 2}'}], []]
+
+    class FakeConn:
+        async def execute(self, query, *args):
+            queries.append(query)
+
+        async def fetch(self, query, *args):
+            queries.append(query)
+            assert args == ("s", 1000)
+            if batches:
+                return batches.pop(0)
+            await asyncio.sleep(3600)  # block until cancelled
+
+        async def close(self):
+            pass
+
+    async def fake_connect(dsn):
+        return FakeConn()
+
+    fake_asyncpg = types.ModuleType("asyncpg")
+    fake_asyncpg.connect = fake_connect
+    monkeypatch.setitem(sys.modules, "asyncpg", fake_asyncpg)
+
+    # A long poll interval: both batches must arrive without waiting on it.
+    connector = PostgresCDCConnector(
+        "pg", dsn="d", slot_name="s", publication="p", poll_interval=60
+    )
+    received = []
+
+    async def cb(event):
+        received.append(event.payload)
+
+    connector.on_event(cb)
+    await connector.start()
+    try:
+        for _ in range(100):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await connector.stop()
+
+    assert received == [{"n": 1}, {"n": 2}]
+    assert "WHERE NOT EXISTS" in queries[0]
+    assert "ON CONFLICT" not in queries[0]
+
+
 # ---------------------------------------------------------------- config store
 
 
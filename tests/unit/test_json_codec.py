@@ -0,0 +1,51 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+
+from genxai.utils import json_codec
+
+
+@dataclass
+class _Record:
+    name: str
+    at: datetime
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_dumps_bytes_handles_datetimes_and_dataclasses(codec):
+    at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    encoded = codec.dumps_bytes({"record": _Record(name="a", at=at), 1: "x"})
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {
+        "record": {"name": "a", "at": "2026-01-02T03:04:05+00:00"},
+        "1": "x",
+    }
+
+
+def test_dumps_bytes_indent_and_loads_text(codec):
+    encoded = codec.dumps_bytes({"a": [1, 2]}, indent=True)
+
+    assert encoded.startswith(b'{\n  "a": [')
+    assert codec.loads(encoded.decode()) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_bytes_backends_produce_identical_bytes(monkeypatch, indent):
+    pytest.importorskip("orjson")
+    doc = {"name": "café", "at": datetime(2026, 1, 2, tzinfo=UTC), "items": [1, {"b": None}]}
+    fast = json_codec.dumps_bytes(doc, indent=indent)
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert json_codec.dumps_bytes(doc, indent=indent) == fast
@@ -0,0 +1,132 @@
+"""Unit tests for memory backend telemetry plugins."""
+
+import sqlite3
+
+import pytest
+
+from genxai.core.memory.backends import (
+    MemoryBackendRegistry,
+    Neo4jMemoryBackendPlugin,
+    RedisMemoryBackendPlugin,
+    SqliteMemoryBackendPlugin,
+)
+
+
+def _trace_sqlite(monkeypatch):
+    """Record every SQL statement run on connections opened from here on."""
+    statements = []
+    real_connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        connection = real_connect(*args, **kwargs)
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    monkeypatch.setattr(sqlite3, "connect", tracing_connect)
+    return statements
+
+
+def test_sqlite_backend_stats_counts_rows_in_one_query(tmp_path, monkeypatch):
+    db_path = tmp_path / "memory.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE episodes (id INTEGER)")
+    conn.execute('CREATE TABLE "odd name" (id INTEGER)')
+    conn.executemany("INSERT INTO episodes VALUES (?)", [(1,), (2,), (3,)])
+    conn.commit()
+    conn.close()
+
+    statements = _trace_sqlite(monkeypatch)
+    stats = SqliteMemoryBackendPlugin(db_path).get_stats()
+
+    assert stats["available"] is True
+    assert stats["table_count"] == 2
+    assert stats["table_rows"] == {"episodes": 3, "odd name": 0}
+    assert stats["db_size_bytes"] > 0
+    assert len([s for s in statements if "COUNT(*)" in s]) == 1
+
+
+def test_sqlite_backend_stats_missing_file_is_not_created(tmp_path):
+    db_path = tmp_path / "missing.db"
+
+    stats = SqliteMemoryBackendPlugin(db_path).get_stats()
+
+    assert stats["available"] is False
+    assert stats["file_size_bytes"] == 0
+    assert not db_path.exists()
+
+
+def test_neo4j_backend_stats_use_one_round_trip():
+    queries = []
+
+    class FakeSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def run(self, query, **params):
+            queries.append(query)
+            return [
+                {
+                    "node_count": 4,
+                    "edge_count": 6,
+                    "traversal_path_count": 5,
+                    "traversal_reachable_nodes": 3,
+                }
+            ]
+
+    class FakeGraph:
+        def session(self):
+            return FakeSession()
+
+    stats = Neo4jMemoryBackendPlugin(FakeGraph(), traversal_depth=3).get_stats()
+
+    assert len(queries) == 1
+    assert "[*1..3]" in queries[0]
+    assert stats["graph_size"] == {"node_count": 4, "edge_count": 6}
+    assert stats["avg_out_degree"] == 1.5
+    assert stats["traversal"] == {"path_count": 5, "reachable_nodes": 3}
+
+
+def test_redis_backend_counts_keys_with_scan():
+    class FakeRedis:
+        def info(self, section=None):
+            return {"used_memory": 50, "maxmemory": 100}
+
+        def keys(self, pattern):
+            raise AssertionError("KEYS blocks the server")
+
+        def scan_iter(self, match=None, count=None):
+            assert match == "genxai:memory:*"
+            yield from (f"genxai:memory:{i}" for i in range(3))
+
+    stats = RedisMemoryBackendPlugin(FakeRedis()).get_stats()
+
+    assert stats["key_count"] == 3
+    assert stats["utilization"] == 0.5
+
+
+def test_memory_backend_registry_create(tmp_path):
+    plugin = MemoryBackendRegistry.create("sqlite", sqlite_path=tmp_path / "m.db")
+    assert isinstance(plugin, SqliteMemoryBackendPlugin)
+
+    with pytest.raises(ValueError, match="Unsupported memory backend plugin: nope") as excinfo:
+        MemoryBackendRegistry.create("nope")
+    assert excinfo.value.__cause__ is None
+    assert excinfo.value.__suppress_context__
+
+
+def test_sqlite_backend_stats_can_skip_row_counts(tmp_path, monkeypatch):
+    db_path = tmp_path / "memory.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE episodes (id INTEGER)")
+    conn.commit()
+    conn.close()
+
+    statements = _trace_sqlite(monkeypatch)
+    stats = SqliteMemoryBackendPlugin(db_path, count_rows=False).get_stats()
+
+    assert stats["table_names"] == ["episodes"]
+    assert "table_rows" not in stats
+    assert not any("COUNT(*)" in statement for statement in statements)
@@ -2,6 +2,9 @@
 
 from pathlib import Path
 
+import pytest
+
+from genxai.core.memory.episodic import EpisodicMemory
 from genxai.core.memory.persistence import (
     MemoryPersistenceConfig,
     JsonMemoryStore,
@@ -43,8 +46,6 @@ def test_create_memory_store_factory(tmp_path: Path) -> None:
     assert isinstance(store, SqliteMemoryStore)
 
 
-import pytest
-
 from genxai.core.memory.base import MemoryConfig
 from genxai.core.memory.manager import MemorySystem
 
@@ -91,3 +92,74 @@ async def test_short_term_clear_also_clears_persisted_file(tmp_path: Path) -> No
 
     second = _memory_system(tmp_path)
     assert await second.get_short_term_context() == ""
+
+
+def _sqlite_episodic(tmp_path: Path, max_episodes: int = 1000) -> EpisodicMemory:
+    config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="sqlite")
+    return EpisodicMemory(persistence=config, max_episodes=max_episodes)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_episodic_memory_writes_single_rows(tmp_path: Path, monkeypatch) -> None:
+    memory = _sqlite_episodic(tmp_path, max_episodes=2)
+    monkeypatch.setattr(
+        SqliteMemoryStore,
+        "save_list",
+        lambda *args: pytest.fail("episodes must not be rewritten as a blob"),
+    )
+    first = await memory.store_episode("a1", "deploy", [], {}, 1.0, True)
+    second = await memory.store_episode("a2", "build", [], {}, 2.0, False)
+    third = await memory.store_episode("a1", "test", [], {}, 3.0, True)
+
+    reloaded = _sqlite_episodic(tmp_path, max_episodes=2)
+    assert first.id not in reloaded._episodes
+    assert list(reloaded._episodes) == [second.id, third.id]
+    assert reloaded._episodes[third.id].to_dict() == third.to_dict()
+
+    await reloaded.clear("a1")
+    assert list(_sqlite_episodic(tmp_path)._episodes) == [second.id]
+
+
+def test_sqlite_episodic_memory_migrates_legacy_blob(tmp_path: Path) -> None:
+    config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="sqlite")
+    legacy = {
+        "id": "ep-1",
+        "agent_id": "a1",
+        "task": "deploy",
+        "actions": [],
+        "outcome": {},
+        "timestamp": "2026-01-01T00:00:00",
+        "duration": 1.0,
+        "success": True,
+        "metadata": {},
+    }
+    SqliteMemoryStore(config).save_list("episodic_memory.json", [legacy])
+
+    assert list(EpisodicMemory(persistence=config)._episodes) == ["ep-1"]
+    store = SqliteMemoryStore(config)
+    assert store.load_list("episodic_memory.json") == []
+    assert store.load_episodes() == [legacy]
+
+
+@pytest.mark.asyncio
+async def test_json_episodic_writes_run_off_loop_and_coalesce(tmp_path: Path, monkeypatch) -> None:
+    import asyncio
+    import threading
+
+    config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="json")
+    memory = EpisodicMemory(persistence=config)
+    writer_threads = []
+    save_list = JsonMemoryStore.save_list
+
+    def spy(self, filename, items):
+        writer_threads.append(threading.get_ident())
+        save_list(self, filename, items)
+
+    monkeypatch.setattr(JsonMemoryStore, "save_list", spy)
+    await asyncio.gather(
+        *(memory.store_episode("a1", f"task {idx}", [], {}, 1.0, True) for idx in range(5))
+    )
+
+    assert len(writer_threads) == 2
+    assert threading.get_ident() not in writer_threads
+    assert len(EpisodicMemory(persistence=config)) == 5
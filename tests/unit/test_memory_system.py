@@ -344,3 +344,223 @@ async def test_older_context_and_prune_to_window():
     assert "m4" in recent_context
     assert "m1" not in recent_context
     assert "m2" not in recent_context
+
+
+@pytest.mark.asyncio
+async def test_backend_plugin_stats_are_collected_off_the_event_loop():
+    """Blocking plugin telemetry should run in worker threads, not on the loop."""
+    import threading
+
+    from genxai.core.memory.backends import MemoryBackendPlugin
+
+    class _ThreadRecordingPlugin(MemoryBackendPlugin):
+        def __init__(self) -> None:
+            super().__init__(backend="fake")
+
+        def get_stats(self) -> dict:
+            return {"thread": threading.get_ident()}
+
+    memory = MemorySystem(agent_id="test_agent")
+    memory._backend_plugins = {"a": _ThreadRecordingPlugin(), "b": _ThreadRecordingPlugin()}
+
+    stats = await memory.get_stats()
+
+    assert set(stats["backend_plugins"]) == {"a", "b"}
+    for plugin_stats in stats["backend_plugins"].values():
+        assert plugin_stats["thread"] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_episodic_eviction_and_agent_queries_use_indexes(monkeypatch):
+    from datetime import datetime, timedelta
+
+    from genxai.core.memory import episodic as episodic_module
+    from genxai.core.memory.episodic import Episode, EpisodicMemory
+
+    memory = EpisodicMemory(max_episodes=3)
+    base = datetime(2026, 1, 1)
+    # Insert out of timestamp order, as a reload from disk may.
+    for idx, offset in enumerate([5, 1, 3]):
+        memory._add_episode(
+            Episode(
+                f"ep-{idx}", f"agent-{idx % 2}", "task", [], {}, base + timedelta(offset), 1.0, True
+            )
+        )
+    monkeypatch.setattr(
+        episodic_module,
+        "min",
+        lambda *a, **k: pytest.fail("eviction scanned all episodes"),
+        raising=False,
+    )
+
+    await memory.store_episode("agent-1", "new task", [], {}, 1.0, False)
+    assert "ep-1" not in memory._episodes
+    assert len(memory) == 3
+    assert [ep.id for ep in await memory.retrieve_by_agent("agent-0")] == ["ep-0", "ep-2"]
+    assert len(await memory.retrieve_by_agent("agent-1")) == 1
+    assert await memory.get_success_rate(agent_id="agent-1") == 0.0
+
+    await memory.clear("agent-0")
+    assert memory._by_agent.keys() == {"agent-1"}
+    await memory.store_episode("agent-1", "again", [], {}, 1.0, True)
+    await memory.store_episode("agent-1", "more", [], {}, 1.0, True)
+    assert len(memory) == 3
+    assert list(memory._by_agent["agent-1"]) == list(memory._episodes)
+
+
+@pytest.mark.asyncio
+async def test_episodic_agent_queries_keep_insertion_order():
+    from datetime import datetime
+
+    from genxai.core.memory.episodic import Episode, EpisodicMemory
+
+    memory = EpisodicMemory()
+    same_time = datetime(2026, 1, 1)
+    for idx in range(40):
+        memory._add_episode(
+            Episode(f"ep-{idx}", f"agent-{idx % 2}", f"task {idx}", [], {}, same_time, 1.0, True)
+        )
+    expected = [ep for ep in memory._episodes.values() if ep.agent_id == "agent-0"]
+
+    # Ties on timestamp come back in insertion order, as with a stable sort.
+    assert await memory.retrieve_by_agent("agent-0", limit=40) == expected
+    patterns = await memory.get_patterns(agent_id="agent-0", min_occurrences=1)
+    assert [p["task"] for p in patterns] == [ep.task for ep in expected]
+
+    # Replacing an episode under another agent keeps its original position.
+    moved = Episode(expected[0].id, "agent-1", "moved", [], {}, same_time, 1.0, True)
+    memory._add_episode(moved)
+    assert (await memory.retrieve_by_agent("agent-1", limit=40))[0] is moved
+
+
+@pytest.mark.asyncio
+async def test_episodic_queries_use_cached_lowercase_task():
+    from genxai.core.memory.episodic import EpisodicMemory
+
+    class _NoLower(str):
+        def lower(self):
+            pytest.fail("task lowercased during a query")
+
+    memory = EpisodicMemory()
+    episode = await memory.store_episode("agent-1", "Deploy Service", [], {}, 1.0, True)
+    episode._task = _NoLower(episode.task)
+
+    assert await memory.retrieve_similar_tasks("deploy") == [episode]
+    assert await memory.get_success_rate(task_pattern="SERVICE") == 1.0
+    assert (await memory.get_patterns(min_occurrences=1))[0]["task"] == "deploy service"
+
+    episode.task = "Rollback"
+    assert await memory.retrieve_similar_tasks("deploy") == []
+    assert await memory.retrieve_similar_tasks("rollback") == [episode]
+
+
+@pytest.mark.asyncio
+async def test_episodic_stats_count_agents_from_index():
+    from datetime import datetime
+
+    from genxai.core.memory.episodic import Episode, EpisodicMemory
+
+    memory = EpisodicMemory(max_episodes=2)
+    memory._add_episode(Episode("a", "agent-1", "a", [], {}, datetime(2000, 1, 1), 1.0, True))
+    memory._add_episode(Episode("b", "agent-2", "b", [], {}, datetime(2000, 1, 2), 3.0, False))
+    await memory.store_episode("agent-2", "c", [], {}, 5.0, True)
+
+    stats = await memory.get_stats()
+    assert stats["unique_agents"] == 1
+    assert stats["total_episodes"] == 2
+    assert stats["successful_episodes"] == 1
+    assert stats["avg_duration"] == 4.0
+    assert stats["oldest_episode"] == "2000-01-02T00:00:00"
+    assert stats["newest_episode"] > stats["oldest_episode"]
+
+
+@pytest.mark.asyncio
+async def test_graph_episode_payloads_use_json_codec():
+    from datetime import datetime
+
+    from genxai.core.memory.episodic import EpisodicMemory
+
+    graph_driver = _FakeGraphDriver()
+    memory = EpisodicMemory(graph_db=graph_driver)
+    episode = await memory.store_episode(
+        "agent-1",
+        "deploy",
+        [{"cmd": "ship ✓"}],
+        {"at": datetime(2026, 1, 2, 3, 4, 5)},
+        1.0,
+        True,
+    )
+
+    stored = graph_driver.storage["episodes"][episode.id]
+    assert stored["actions_json"] == '[{"cmd":"ship ✓"}]'
+    assert stored["outcome_json"] == '{"at":"2026-01-02T03:04:05"}'
+    memory._episodes.clear()
+    fetched = await memory.retrieve_episode(episode.id)
+    assert fetched.outcome == {"at": "2026-01-02T03:04:05"}
+
+
+@pytest.mark.asyncio
+async def test_episodic_top_k_uses_partial_selection(monkeypatch):
+    from genxai.core.memory import episodic as episodic_module
+    from genxai.core.memory.episodic import EpisodicMemory
+
+    memory = EpisodicMemory()
+    stored = [
+        await memory.store_episode("a1", "deploy", [], {}, 1.0, idx % 2 == 0) for idx in range(6)
+    ]
+    calls = []
+    nlargest = episodic_module.heapq.nlargest
+
+    def spy(n, iterable, key):
+        calls.append(n)
+        return nlargest(n, iterable, key=key)
+
+    monkeypatch.setattr(episodic_module.heapq, "nlargest", spy)
+
+    assert await memory.retrieve_by_agent("a1", limit=2) == stored[:-3:-1]
+    assert await memory.retrieve_similar_tasks("deploy", limit=2) == [stored[4], stored[2]]
+    assert calls == [2, 2]
+
+
+def test_episode_has_no_instance_dict():
+    from datetime import datetime
+
+    from genxai.core.memory.episodic import Episode
+
+    episode = Episode("ep", "a1", "Task", [], {}, datetime(2026, 1, 1), 1.0, True)
+    assert not hasattr(episode, "__dict__")
+    assert Episode.from_dict(episode.to_dict()).to_dict() == episode.to_dict()
+
+
+@pytest.mark.asyncio
+async def test_episodic_patterns_aggregate_per_task():
+    from datetime import datetime
+
+    from genxai.core.memory.episodic import Episode, EpisodicMemory
+
+    memory = EpisodicMemory()
+    for idx, (task, success, duration) in enumerate(
+        [("Deploy", True, 1.0), ("deploy", False, 3.0), ("build", True, 2.0), ("DEPLOY", True, 5.0)]
+    ):
+        memory._add_episode(
+            Episode(f"ep-{idx}", "a1", task, [], {}, datetime(2026, 1, 1 + idx), duration, success)
+        )
+
+    patterns = await memory.get_patterns(min_occurrences=1)
+    assert patterns == [
+        {
+            "task": "deploy",
+            "occurrences": 3,
+            "success_rate": 2 / 3,
+            "avg_duration": 3.0,
+            "last_seen": "2026-01-04T00:00:00",
+        },
+        {
+            "task": "build",
+            "occurrences": 1,
+            "success_rate": 1.0,
+            "avg_duration": 2.0,
+            "last_seen": "2026-01-03T00:00:00",
+        },
+    ]
+    assert await memory.get_patterns(min_occurrences=2) == patterns[:1]
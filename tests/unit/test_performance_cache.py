@@ -27,6 +27,8 @@ def test_cache_manager_key_determinism() -> None:
     key1 = cache.cache_key("prefix", 1, b=2)
     key2 = cache.cache_key("prefix", 1, b=2)
     assert key1 == key2
+    assert key1.startswith("prefix:") and len(key1.split(":", 1)[1]) == 32
+    assert cache.cache_key("prefix", 1, b=3) != key1
 
 
 def test_lru_cache_eviction() -> None:
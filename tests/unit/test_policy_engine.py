@@ -21,4 +21,38 @@ def test_policy_engine_denies_acl():
     user = User(user_id="bob", role=Role.DEVELOPER)
 
     with pytest.raises(PermissionDenied):
-        engine.check(user, "tool:sensitive", Permission.TOOL_EXECUTE)
\ No newline at end of file
+        engine.check(user, "tool:sensitive", Permission.TOOL_EXECUTE)
+
+
+def test_tool_allow_and_deny_lists_are_normalized(monkeypatch):
+    import genxai.config.settings as settings_module
+    from genxai.config import GenXAISettings
+    from genxai.tools.security.policy import is_tool_allowed
+
+    settings = GenXAISettings(tool_allowlist=[" calc ", "web", ""], tool_denylist=["web"])
+    monkeypatch.setattr(settings_module, "_settings", settings)
+
+    assert settings.allowlist_set() == frozenset({"calc", "web"})
+    assert is_tool_allowed("calc") == (True, None)
+    assert is_tool_allowed("web")[0] is False
+    assert is_tool_allowed("other")[0] is False
+
+
+def test_tool_deny_list_changes_apply_after_construction(monkeypatch):
+    import genxai.config.settings as settings_module
+    from genxai.config import GenXAISettings
+    from genxai.tools.security.policy import is_tool_allowed
+
+    settings = GenXAISettings(tool_denylist=["shell"])
+    monkeypatch.setattr(settings_module, "_settings", settings)
+    assert is_tool_allowed("calc") == (True, None)
+
+    settings.tool_denylist = ["calc"]
+    assert is_tool_allowed("calc")[0] is False
+    assert is_tool_allowed("shell") == (True, None)
+
+    settings.tool_denylist.append(" shell ")
+    assert is_tool_allowed("shell")[0] is False
+
+    settings.tool_allowlist.append("web")
+    assert is_tool_allowed("other")[0] is False
@@ -158,11 +158,19 @@ async def test_registry_start_all_stop_all_and_stats():
 # ---------------------------------------------------------------- webhook
 
 
+_PAYLOAD = {"a": 1}
+_BODY = b'{"a": 1}'
+
+
 def _sign(secret: str, body: bytes, alg: str = "sha256") -> str:
     digest = hmac.new(secret.encode(), body, getattr(hashlib, alg)).hexdigest()
     return f"{alg}={digest}"
 
 
+def _signed_headers(secret: str, body: bytes = _BODY) -> dict[str, str]:
+    return {"X-GenXAI-Signature": _sign(secret, body)}
+
+
 def test_webhook_signature_no_secret_accepts_anything():
     trigger = WebhookTrigger("wh1")
     assert trigger.validate_signature(b"body", None) is True
@@ -170,10 +178,18 @@ def test_webhook_signature_no_secret_accepts_anything():
 
 def test_webhook_signature_validation():
     trigger = WebhookTrigger("wh1", secret="s3cret")
-    body = b'{"a": 1}'
-    assert trigger.validate_signature(body, _sign("s3cret", body)) is True
-    assert trigger.validate_signature(body, _sign("wrong", body)) is False
-    assert trigger.validate_signature(body, None) is False
+    assert trigger.validate_signature(_BODY, _sign("s3cret", _BODY)) is True
+    assert trigger.validate_signature(_BODY, _sign("wrong", _BODY)) is False
+    assert trigger.validate_signature(_BODY, None) is False
+
+
+def test_webhook_signature_rejects_malformed_headers():
+    trigger = WebhookTrigger("wh1", secret="s3cret")
+    valid_hex = _sign("s3cret", _BODY).split("=", 1)[1]
+    assert trigger.validate_signature(_BODY, valid_hex) is False
+    assert trigger.validate_signature(_BODY, f"sha1={valid_hex}") is False
+    assert trigger.validate_signature(_BODY, "sha256=not-hex") is False
+    assert trigger.validate_signature(_BODY, f"sha256={valid_hex.upper()}") is True
 
 
 @pytest.mark.asyncio
@@ -185,16 +201,15 @@ async def test_webhook_handle_request_accepted():
         received.append(event)
 
     trigger.on_event(cb)
-    body = b'{"a": 1}'
     result = await trigger.handle_request(
-        payload={"a": 1},
-        raw_body=body,
-        headers={"X-GenXAI-Signature": _sign("s3cret", body)},
+        payload=_PAYLOAD,
+        raw_body=_BODY,
+        headers=_signed_headers("s3cret"),
     )
 
     assert result == {"status": "accepted", "trigger_id": "wh1"}
     assert len(received) == 1
-    assert received[0].payload == {"a": 1}
+    assert received[0].payload == _PAYLOAD
     assert received[0].metadata["headers"]["X-GenXAI-Signature"].startswith("sha256=")
 
 
@@ -208,8 +223,8 @@ async def test_webhook_handle_request_rejects_bad_signature():
 
     trigger.on_event(cb)
     result = await trigger.handle_request(
-        payload={"a": 1},
-        raw_body=b'{"a": 1}',
+        payload=_PAYLOAD,
+        raw_body=_BODY,
         headers={"X-GenXAI-Signature": "sha256=bogus"},
     )
 
@@ -217,6 +232,111 @@ async def test_webhook_handle_request_rejects_bad_signature():
     assert received == []
 
 
+@pytest.mark.asyncio
+async def test_webhook_handle_request_verifies_large_body_off_loop(monkeypatch):
+    from genxai.triggers import webhook as webhook_module
+    from genxai.triggers.webhook import OFFLOAD_SIGNATURE_BYTES
+
+    offloaded = []
+    to_thread = asyncio.to_thread
+
+    async def spy_to_thread(func, *args, **kwargs):
+        offloaded.append(len(args[0]))
+        return await to_thread(func, *args, **kwargs)
+
+    monkeypatch.setattr(webhook_module.asyncio, "to_thread", spy_to_thread)
+    trigger = WebhookTrigger("wh1", secret="s3cret")
+    small = b"x" * (OFFLOAD_SIGNATURE_BYTES - 1)
+    body = b"x" * OFFLOAD_SIGNATURE_BYTES
+
+    inline = await trigger.handle_request(
+        payload={}, raw_body=small, headers=_signed_headers("s3cret", small)
+    )
+    assert inline["status"] == "accepted"
+    assert offloaded == []
+
+    accepted = await trigger.handle_request(
+        payload={}, raw_body=body, headers=_signed_headers("s3cret", body)
+    )
+    rejected = await trigger.handle_request(
+        payload={}, raw_body=body, headers=_signed_headers("wrong", body)
+    )
+
+    assert accepted["status"] == "accepted"
+    assert rejected["status"] == "rejected"
+    assert offloaded == [OFFLOAD_SIGNATURE_BYTES, OFFLOAD_SIGNATURE_BYTES]
+
+
+@pytest.mark.asyncio
+async def test_webhook_handle_request_dedupes_redelivered_events():
+    trigger = WebhookTrigger("wh1", dedupe_max_entries=1)
+    received = []
+
+    async def cb(event):
+        received.append(event)
+
+    trigger.on_event(cb)
+    headers = {"X-GenXAI-Delivery": "evt-1"}
+    first = await trigger.handle_request(payload=_PAYLOAD, headers=headers)
+    second = await trigger.handle_request(payload=_PAYLOAD, headers=headers)
+
+    assert first == second == {"status": "accepted", "trigger_id": "wh1"}
+    assert len(received) == 1
+
+    # The oldest delivery is evicted once the cache is full.
+    await trigger.handle_request(payload={"a": 2}, headers={"X-GenXAI-Delivery": "evt-2"})
+    await trigger.handle_request(payload=_PAYLOAD, headers=headers)
+    assert len(received) == 3
+
+
+@pytest.mark.asyncio
+async def test_webhook_handle_request_dedupes_concurrent_redeliveries():
+    trigger = WebhookTrigger("wh1")
+    release = asyncio.Event()
+    received = []
+
+    async def cb(event):
+        received.append(event)
+        await release.wait()
+
+    trigger.on_event(cb)
+    headers = {"X-GenXAI-Delivery": "evt-1"}
+    pending = [
+        asyncio.create_task(trigger.handle_request(payload=_PAYLOAD, headers=headers))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+
+    assert results == [{"status": "accepted", "trigger_id": "wh1"}] * 3
+    assert len(received) == 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_handle_request_retries_delivery_after_failed_emit():
+    trigger = WebhookTrigger("wh1")
+    attempts = []
+
+    async def cb(event):
+        attempts.append(event)
+        await asyncio.sleep(0)
+        if len(attempts) == 1:
+            raise RuntimeError("downstream unavailable")
+
+    trigger.on_event(cb)
+    headers = {"X-GenXAI-Delivery": "evt-1"}
+    first, second = await asyncio.gather(
+        trigger.handle_request(payload=_PAYLOAD, headers=headers),
+        trigger.handle_request(payload=_PAYLOAD, headers=headers),
+        return_exceptions=True,
+    )
+
+    assert isinstance(first, RuntimeError)
+    assert second == {"status": "accepted", "trigger_id": "wh1"}
+    assert len(attempts) == 2
+
+
 @pytest.mark.asyncio
 async def test_webhook_start_stop():
     trigger = WebhookTrigger("wh1")